@@ -69,15 +69,19 @@ class BinaryApiData(ApiData):
         ```
     """
 
-    def __init__(self, data: bytes) -> None:
+    def __init__(self, data: t.Union[bytes, bytearray, memoryview]) -> None:
         """
         Args:
-            data: Binary data.
+            data: Binary data. Buffers are kept as they are without copying.
         """
         self._data = data
 
     @classmethod
-    def __validate__(cls, raw: bytes, content_type: ContentType) -> BinaryApiData:
+    def __validate__(
+        cls,
+        raw: t.Union[bytes, bytearray, memoryview],
+        content_type: ContentType,
+    ) -> BinaryApiData:
         """
         Args:
             raw: Raw data to be validated.
@@ -90,12 +94,14 @@ class BinaryApiData(ApiData):
             In objects of this class, `content_type` is not used even if any
             `content_type` is specified.
         """
-        if not isinstance(raw, bytes):
-            raise ApiValidationFailedError(f"'raw' must be a 'bytes'.")
+        if not isinstance(raw, (bytes, bytearray, memoryview)):
+            raise ApiValidationFailedError(
+                "'raw' must be a 'bytes', 'bytearray' or 'memoryview'."
+            )
         return cls(raw)
 
     @property
-    def raw(self) -> bytes:
+    def raw(self) -> t.Union[bytes, bytearray, memoryview]:
         """Raw data of input binary."""
         return self._data
 
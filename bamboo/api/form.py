@@ -5,6 +5,7 @@ import urllib.parse
 from .base import ApiData, ApiValidationFailedError
 from ..http import ContentType, MediaTypes
 from ..util.deco import cached_property, class_property
+from ..util.typing import get_type_hints
 
 
 TYPES_ARGS = (str,)
@@ -19,7 +20,7 @@ def _check_annotation(typ: t.Type) -> None:
 
 
 def _has_valid_annotations(apiclass: t.Type[FormApiData]) -> None:
-    for typ in t.get_type_hints(apiclass).values():
+    for typ in get_type_hints(apiclass).values():
         _check_annotation(typ)
 
 
@@ -28,7 +29,7 @@ def _build_dict(
     **data: str,
 ) -> FormApiData:
     instance = apiclass.__new__(apiclass)
-    annotations = t.get_type_hints(apiclass)
+    annotations = get_type_hints(apiclass)
 
     for key in annotations.keys():
         if key not in data:
@@ -142,7 +143,7 @@ class FormApiData(ApiData):
 
     @cached_property
     def dict(self) -> t.Dict[str, t.Any]:
-        keys = t.get_type_hints(self.__class__).keys()
+        keys = get_type_hints(self.__class__).keys()
         return {key: getattr(self, key) for key in keys}
 
     @cached_property
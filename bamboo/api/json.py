@@ -9,7 +9,7 @@ from ..http import (
     MediaTypes,
 )
 from ..util.deco import cached_property, class_property
-from ..util.typing import get_args, get_origin
+from ..util.typing import get_args, get_origin, get_type_hints
 
 
 NoneType = type(None)
@@ -55,7 +55,7 @@ def _check_annotation(typ: t.Type) -> None:
 
 
 def _has_valid_annotations(apiclass: t.Type[JsonApiData]) -> None:
-    for typ in t.get_type_hints(apiclass).values():
+    for typ in get_type_hints(apiclass).values():
         _check_annotation(typ)
 
 
@@ -87,7 +87,7 @@ def _build_json_api(
     data: t.Dict[str, t.Any]
 ) -> JsonApiData:
     instance = apiclass.__new__(apiclass)
-    annotations = t.get_type_hints(apiclass)
+    annotations = get_type_hints(apiclass)
 
     # NOTE
     #   Ignore keys of data which is not defined in the apiclass.
@@ -173,7 +173,7 @@ def _extract_dict(api: JsonApiData) -> t.Dict[str, t.Any]:
     cls = type(api)
     res = {}
 
-    for key, type_def in t.get_type_hints(cls).items():
+    for key, type_def in get_type_hints(cls).items():
         if hasattr(api, key):
             val = getattr(api, key)
             if isinstance(val, JsonApiData):
@@ -267,6 +267,12 @@ class JsonApiData(ApiData):
                 "Decoding raw data failed."
                 "The raw data had invalid JSON format."
             )
+
+        if not isinstance(data, dict):
+            raise ApiValidationFailedError(
+                "Raw data must be a JSON object, "
+                f"but {data.__class__.__name__} was given."
+            )
         return cls(**data)
 
     def __extract__(self) -> bytes:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+from types import MappingProxyType
 import urllib.parse
 import typing as t
 
@@ -14,6 +15,12 @@ __all__ = [
 
 ResponseData_t = t.TypeVar("ResponseData_t", bound=ApiData)
 
+# NOTE
+#   Read-only defaults of request functions. Mutable defaults would be
+#   shared by every call and could be modified by one of them.
+_EMPTY_HEADERS: t.Mapping[str, str] = MappingProxyType({})
+_EMPTY_QUERY: t.Mapping[str, t.List[str]] = MappingProxyType({})
+
 
 class _Schemes:
 
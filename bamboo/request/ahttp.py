@@ -6,21 +6,26 @@ from . import http
 from ..api.base import BinaryApiData
 from ..api.json import JsonApiData
 from ..http import HTTPMethods
-from ..request import ResponseData_t, Response
+from ..request import (
+    _EMPTY_HEADERS,
+    _EMPTY_QUERY,
+    ResponseData_t,
+    Response,
+)
 
 
 async def request(
     uri: str,
     method: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     eloop = asyncio.get_event_loop()
@@ -42,15 +47,15 @@ async def request(
 
 async def get(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the GET method on HTTP asynchronously.
@@ -90,15 +95,15 @@ async def get(
 
 async def post(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the POST method on HTTP asynchronously.
@@ -138,15 +143,15 @@ async def post(
 
 async def put(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the PUT method on HTTP asynchronously.
@@ -186,15 +191,15 @@ async def put(
 
 async def delete(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the DELETE method on HTTP asynchronously.
@@ -234,15 +239,15 @@ async def delete(
 
 async def head(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the HEAD method on HTTP asynchronously.
@@ -282,15 +287,15 @@ async def head(
 
 async def options(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the OPTIONS method on HTTP asynchronously.
@@ -330,15 +335,15 @@ async def options(
 
 async def patch(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the PATCH method on HTTP asynchronously.
@@ -378,15 +383,15 @@ async def patch(
 
 async def trace(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the TRACE method on HTTP asynchronously.
@@ -426,15 +431,15 @@ async def trace(
 
 async def connect(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     executor: t.Optional[concurrent.futures.Executor] = None,
 ) -> Response[ResponseData_t]:
     """Request with the CONNECT method on HTTP asynchronously.
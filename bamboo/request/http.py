@@ -2,7 +2,12 @@ from __future__ import annotations
 import http.client
 import typing as t
 
-from . import _get_http_proxy_env, _parse_proxy_netloc
+from . import (
+    _EMPTY_HEADERS,
+    _EMPTY_QUERY,
+    _get_http_proxy_env,
+    _parse_proxy_netloc,
+)
 from ..api.base import BinaryApiData
 from ..api.json import JsonApiData
 from ..http import HTTPMethods
@@ -27,15 +32,15 @@ __all__ = [
 def request(
     uri: str,
     method: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     form = get_http_request_form(
         Schemes.HTTP,
@@ -76,20 +81,26 @@ def request(
 
     conn.request(form.method, form.path, body=form.body, headers=form.headers)
     _res = conn.getresponse()
-    return Response(conn, _res, form.uri, datacls=datacls)
+    return Response(
+        conn,
+        _res,
+        form.uri,
+        datacls=datacls,
+        decode_content=form.decode_content,
+    )
 
 
 def get(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the GET method on HTTP.
 
@@ -126,15 +137,15 @@ def get(
 
 def post(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the POST method on HTTP.
 
@@ -171,15 +182,15 @@ def post(
 
 def put(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the PUT method on HTTP.
 
@@ -216,15 +227,15 @@ def put(
 
 def delete(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the DELETE method on HTTP.
 
@@ -261,15 +272,15 @@ def delete(
 
 def head(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the HEAD method on HTTP.
 
@@ -306,15 +317,15 @@ def head(
 
 def options(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the OPTIONS method on HTTP.
 
@@ -351,15 +362,15 @@ def options(
 
 def patch(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the PATCH method on HTTP.
 
@@ -396,15 +407,15 @@ def patch(
 
 def trace(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the TRACE method on HTTP.
 
@@ -441,15 +452,15 @@ def trace(
 
 def connect(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the CONNECT method on HTTP.
 
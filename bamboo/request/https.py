@@ -1,9 +1,15 @@
 from __future__ import annotations
+import functools
 import http.client
 import ssl
 import typing as t
 
-from . import _get_https_proxy_env, _parse_proxy_netloc
+from . import (
+    _EMPTY_HEADERS,
+    _EMPTY_QUERY,
+    _get_https_proxy_env,
+    _parse_proxy_netloc,
+)
 from ..api.base import BinaryApiData
 from ..api.json import JsonApiData
 from ..http import HTTPMethods
@@ -13,6 +19,7 @@ from ..request.response import Response
 
 
 __all__ = [
+    "Session",
     "connect",
     "delete",
     "get",
@@ -25,30 +32,15 @@ __all__ = [
 ]
 
 
-def request(
-    uri: str,
-    method: str,
-    headers: t.Dict[str, str] = {},
-    body: t.Optional[bytes] = None,
-    json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
-    timeout: t.Optional[float] = None,
-    blocksize: int = 8192,
-    datacls: t.Type[ResponseData_t] = BinaryApiData,
-    context: t.Optional[ssl.SSLContext] = None,
-    use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
-) -> Response[ResponseData_t]:
-    form = get_http_request_form(
-        Schemes.HTTPS,
-        uri,
-        method,
-        headers=headers,
-        body=body,
-        json=json,
-        query=query
-    )
-
+def _get_connection(
+    host: str,
+    port: t.Optional[int],
+    timeout: t.Optional[float],
+    blocksize: int,
+    context: t.Optional[ssl.SSLContext],
+    use_proxy: t.Union[bool, t.Tuple[str, int]],
+    proxy_headers: t.Mapping[str, str],
+) -> http.client.HTTPSConnection:
     if use_proxy:
         _http_proxy_env = _get_https_proxy_env()
         if isinstance(use_proxy, tuple):
@@ -68,33 +60,75 @@ def request(
             timeout=timeout,
             blocksize=blocksize,
         )
-        conn.set_tunnel(form.host, port=form.port, headers=proxy_headers)
+        conn.set_tunnel(host, port=port, headers=proxy_headers)
     else:
         conn = http.client.HTTPSConnection(
-            form.host,
-            port=form.port,
+            host,
+            port=port,
             context=context,
             timeout=timeout,
             blocksize=blocksize,
         )
 
+    return conn
+
+
+def request(
+    uri: str,
+    method: str,
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+    body: t.Optional[bytes] = None,
+    json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+    timeout: t.Optional[float] = None,
+    blocksize: int = 8192,
+    datacls: t.Type[ResponseData_t] = BinaryApiData,
+    context: t.Optional[ssl.SSLContext] = None,
+    use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+) -> Response[ResponseData_t]:
+    form = get_http_request_form(
+        Schemes.HTTPS,
+        uri,
+        method,
+        headers=headers,
+        body=body,
+        json=json,
+        query=query
+    )
+
+    conn = _get_connection(
+        form.host,
+        form.port,
+        timeout,
+        blocksize,
+        context,
+        use_proxy,
+        proxy_headers,
+    )
     conn.request(form.method, form.path, body=form.body, headers=form.headers)
     _res = conn.getresponse()
-    return Response(conn, _res, form.uri, datacls=datacls)
+    return Response(
+        conn,
+        _res,
+        form.uri,
+        datacls=datacls,
+        decode_content=form.decode_content,
+    )
 
 
 def get(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the GET method on HTTPS.
 
@@ -139,16 +173,16 @@ def get(
 
 def post(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the POST method on HTTPS.
 
@@ -193,16 +227,16 @@ def post(
 
 def put(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the PUT method on HTTPS.
 
@@ -247,16 +281,16 @@ def put(
 
 def delete(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the DELETE method on HTTPS.
 
@@ -301,16 +335,16 @@ def delete(
 
 def head(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the HEAD method on HTTPS.
 
@@ -355,16 +389,16 @@ def head(
 
 def options(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the OPTIONS method on HTTPS.
 
@@ -409,16 +443,16 @@ def options(
 
 def patch(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the PATCH method on HTTPS.
 
@@ -463,16 +497,16 @@ def patch(
 
 def trace(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the TRACE method on HTTPS.
 
@@ -517,16 +551,16 @@ def trace(
 
 def connect(
     uri: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
-    query: t.Dict[str, t.List[str]] = {},
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
     timeout: t.Optional[float] = None,
     blocksize: int = 8192,
     datacls: t.Type[ResponseData_t] = BinaryApiData,
     context: t.Optional[ssl.SSLContext] = None,
     use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
-    proxy_headers: t.Dict[str, str] = {},
+    proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
 ) -> Response[ResponseData_t]:
     """Request with the CONNECT method on HTTPS.
 
@@ -567,3 +601,494 @@ def connect(
         use_proxy=use_proxy,
         proxy_headers=proxy_headers,
     )
+
+
+_IDEMPOTENT_METHODS = frozenset((
+    HTTPMethods.GET,
+    HTTPMethods.HEAD,
+    HTTPMethods.OPTIONS,
+    HTTPMethods.PUT,
+    HTTPMethods.DELETE,
+    HTTPMethods.TRACE,
+))
+
+
+class Session:
+    """Client holding settings and connections shared by its requests.
+
+    Request functions of this module are stateless, so an SSL context
+    and a connection are set up on every call. A session does them once
+    and keeps connections to each host alive, and so repeated requests
+    to the same hosts are much cheaper.
+
+    Note:
+        A connection is reused only if its response was read out and
+        closed. Close responses, or use them with the `with` sentence.
+        If a reused connection is lost before its response arrives, the
+        request is sent again on another connection only if its method
+        is idempotent.
+
+    Examples:
+        ```python
+        from bamboo.request import https
+
+        with https.Session(headers={"User-Agent": "bamboo"}) as session:
+            for uri in uris:
+                with session.get(uri) as res:
+                    body = res.body
+        ```
+    """
+
+    def __init__(
+        self,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        timeout: t.Optional[float] = None,
+        blocksize: int = 8192,
+        context: t.Optional[ssl.SSLContext] = None,
+        use_proxy: t.Union[bool, t.Tuple[str, int]] = False,
+        proxy_headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+    ) -> None:
+        """
+        Args:
+            headers: Request headers sent on every request.
+            timeout: Seconds waiting for the connection.
+            blocksize: Block size of sending data.
+            context: SSLContext of your communication. The default one
+                will be created if not specified.
+            use_proxy: Address of a proxy server or whether the connection
+                uses a proxy based on the environment variables.
+            proxy_headers: Headers to be used on the request to the proxy.
+        """
+        if context is None:
+            context = ssl.create_default_context()
+
+        self._headers = dict(headers)
+        self._timeout = timeout
+        self._blocksize = blocksize
+        self._context = context
+        self._use_proxy = use_proxy
+        self._proxy_headers = proxy_headers
+        self._pool: t.Dict[
+            t.Tuple[str, t.Optional[int]],
+            t.List[http.client.HTTPSConnection],
+        ] = {}
+
+    @property
+    def headers(self) -> t.Dict[str, str]:
+        """Request headers sent on every request.
+        """
+        return self._headers
+
+    def _release(
+        self,
+        key: t.Tuple[str, t.Optional[int]],
+        conn: http.client.HTTPSConnection,
+        res: http.client.HTTPResponse,
+    ) -> None:
+        if res.isclosed() and not res.will_close:
+            self._pool.setdefault(key, []).append(conn)
+        else:
+            conn.close()
+
+    def request(
+        self,
+        uri: str,
+        method: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with specified method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            method: HTTP method.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        if headers:
+            headers = {**self._headers, **headers}
+        else:
+            headers = self._headers
+
+        form = get_http_request_form(
+            Schemes.HTTPS,
+            uri,
+            method,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query
+        )
+        key = (form.host, form.port)
+        release = functools.partial(self._release, key)
+
+        idle = self._pool.get(key)
+        while idle:
+            conn = idle.pop()
+            try:
+                conn.request(form.method, form.path, form.body, form.headers)
+            except ConnectionError:
+                # NOTE
+                #   The server may have closed the idle connection.
+                conn.close()
+                continue
+            try:
+                _res = conn.getresponse()
+            except ConnectionError:
+                # NOTE
+                #   The request may have been processed by the server
+                #   before the connection was lost, so only requests
+                #   which are safe to repeat are sent again.
+                conn.close()
+                if form.method in _IDEMPOTENT_METHODS:
+                    continue
+                raise
+            return Response(
+                conn,
+                _res,
+                form.uri,
+                datacls=datacls,
+                release=release,
+                decode_content=form.decode_content,
+            )
+
+        conn = _get_connection(
+            form.host,
+            form.port,
+            self._timeout,
+            self._blocksize,
+            self._context,
+            self._use_proxy,
+            self._proxy_headers,
+        )
+        conn.request(form.method, form.path, form.body, form.headers)
+        _res = conn.getresponse()
+        return Response(
+            conn,
+            _res,
+            form.uri,
+            datacls=datacls,
+            release=release,
+            decode_content=form.decode_content,
+        )
+
+    def get(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the GET method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.GET,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def post(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the POST method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.POST,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def put(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the PUT method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.PUT,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def delete(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the DELETE method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.DELETE,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def head(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the HEAD method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.HEAD,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def options(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the OPTIONS method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.OPTIONS,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def patch(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the PATCH method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.PATCH,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def trace(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the TRACE method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.TRACE,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def connect(
+        self,
+        uri: str,
+        headers: t.Mapping[str, str] = _EMPTY_HEADERS,
+        body: t.Optional[bytes] = None,
+        json: t.Union[t.Dict[str, t.Any], JsonApiData] = None,
+        query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
+        datacls: t.Type[ResponseData_t] = BinaryApiData,
+    ) -> Response[ResponseData_t]:
+        """Request with the CONNECT method on HTTPS.
+
+        Args:
+            uri: URI to be requested.
+            headers: Request headers, overriding ones of the session.
+            body: Request body of bytes.
+            json: Request body of JSON.
+            query: Query parameters to be attached to the URI.
+            datacls: `ApiData` or its subclass to be attached from
+                the response body.
+
+        Returns:
+            Response object generated with the response.
+        """
+        return self.request(
+            uri,
+            HTTPMethods.CONNECT,
+            headers=headers,
+            body=body,
+            json=json,
+            query=query,
+            datacls=datacls,
+        )
+
+    def close(self) -> None:
+        """Close all the idle connections of the session.
+        """
+        for conns in self._pool.values():
+            for conn in conns:
+                conn.close()
+        self._pool.clear()
+
+    def __enter__(self) -> Session:
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
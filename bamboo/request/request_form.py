@@ -5,6 +5,7 @@ import typing as t
 from urllib.parse import parse_qs, urlparse
 
 from ..api.json import JsonApiData
+from ..request import _EMPTY_HEADERS, _EMPTY_QUERY, Schemes
 from ..http import HTTPMethods, MediaTypes
 from ..util.convert import unparse_qs
 
@@ -12,6 +13,10 @@ from ..util.convert import unparse_qs
 __all__ = []
 
 
+_SCHEME_PREFIXES = {scheme: f"{scheme}://" for scheme in Schemes}
+_ACCEPT_ENCODING = "gzip, deflate"
+
+
 @dataclasses.dataclass
 class HTTPRequestForm:
 
@@ -20,18 +25,19 @@ class HTTPRequestForm:
     uri: str
     path: str
     method: str
-    headers: t.Dict[str, str]
+    headers: t.Mapping[str, str]
     body: t.Optional[bytes]
+    decode_content: bool = False
 
 
 def get_http_request_form(
     scheme: str,
     uri: str,
     method: str,
-    headers: t.Dict[str, str] = {},
+    headers: t.Mapping[str, str] = _EMPTY_HEADERS,
     body: t.Optional[bytes] = None,
     json: t.Union[t.Dict[str, t.Any], JsonApiData, None] = None,
-    query: t.Dict[str, t.List[str]] = {}
+    query: t.Mapping[str, t.List[str]] = _EMPTY_QUERY,
 ) -> HTTPRequestForm:
     # method management
     method = method.upper()
@@ -45,20 +51,37 @@ def get_http_request_form(
                 "Request body is specified both 'body' and 'json'."
             )
         if "Content-Type" not in headers:
-            headers["Content-Type"] = MediaTypes.plain
+            headers = {**headers, "Content-Type": MediaTypes.plain}
     if json is not None:
         if isinstance(json, JsonApiData):
             json = json.dict
         body = js.dumps(json).encode()
         if "Content-Type" not in headers:
-            headers["Content-Type"] = MediaTypes.json
+            headers = {**headers, "Content-Type": MediaTypes.json}
 
-    parsed_uri = urlparse(uri)
-    if parsed_uri.scheme != scheme:
+    # NOTE
+    #   Schemes are case-insensitive, but most URIs are written in
+    #   lowercase and are accepted without any further work.
+    prefix = _SCHEME_PREFIXES[scheme]
+    if not uri.startswith(prefix) and uri[:len(prefix)].lower() != prefix:
         raise ValueError(
-            f"Scheme of specified uri '{parsed_uri.scheme}' is "
-            "not available. Use HTTP."
+            f"Scheme of specified uri '{urlparse(uri).scheme}' is "
+            f"not available. Use {scheme.upper()}."
         )
+    parsed_uri = urlparse(uri)
+
+    # encoding management
+    # NOTE
+    #   Compressed responses are decoded by Response only if the encodings
+    #   are requested here. Callers specifying Accept-Encoding by
+    #   themselves receive the body as it is sent.
+    for name in headers:
+        if name.lower() == "accept-encoding":
+            decode_content = False
+            break
+    else:
+        headers = {**headers, "Accept-Encoding": _ACCEPT_ENCODING}
+        decode_content = True
 
     # port
     port = parsed_uri.port
@@ -67,7 +90,8 @@ def get_http_request_form(
 
     # query
     query_included = parse_qs(parsed_uri.query)
-    query_included.update(query)
+    if query is not _EMPTY_QUERY:
+        query_included.update(query)
     query = unparse_qs(query_included)
 
     # path
@@ -85,5 +109,6 @@ def get_http_request_form(
         path,
         method,
         headers,
-        body
+        body,
+        decode_content,
     )
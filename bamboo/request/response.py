@@ -1,16 +1,24 @@
 from __future__ import annotations
 import http.client
 import typing as t
+import zlib
 
 from ..api.base import BinaryApiData
 from ..http import ContentType
 from ..request import ResponseData_t
-from ..util.deco import cached_property
 
 
 __all__ = []
 
 
+_DECODABLE_ENCODINGS = frozenset(("gzip", "x-gzip", "deflate"))
+
+ConnectionRelease_t = t.Callable[
+    [http.client.HTTPConnection, http.client.HTTPResponse],
+    None,
+]
+
+
 class ResponseBodyAlreadyReadError(Exception):
     """Response body has already been read and data consistensy would be
     broken.
@@ -44,6 +52,8 @@ class Response(t.Generic[ResponseData_t]):
         res: http.client.HTTPResponse,
         uri: str,
         datacls: t.Type[ResponseData_t] = BinaryApiData,
+        release: t.Optional[ConnectionRelease_t] = None,
+        decode_content: bool = False,
     ) -> None:
         """
         Args:
@@ -51,12 +61,48 @@ class Response(t.Generic[ResponseData_t]):
             res: HTTPResponse of a request.
             uri: Requested URI.
             datacls: ApiData class to attach raw response body.
+            release: Callback receiving the connection and the response
+                on closing instead of closing the connection.
+            decode_content: Whether the body compressed with gzip or
+                deflate is decompressed on reading.
         """
         self._conn = conn
         self._res = res
         self._uri = uri
+        self._status = res.status
+        self._version = res.version
         self._datacls = datacls
+        self._release = release
+        self._is_released = False
         self._is_read = False
+        self._body: t.Optional[bytes] = None
+        self._content_type: t.Union[ContentType, None, bool] = False
+        self._headers: t.Optional[t.Dict[str, str]] = None
+
+        # NOTE
+        #   HTTPResponse has already parsed Content-Length, but it reports
+        #   0 for responses without bodies such as ones to HEAD requests.
+        #   The header is parsed at the first access in such cases.
+        #   HTTPResponse decreases the length as it reads the body, so it
+        #   is taken here.
+        self._content_length: t.Union[int, None, bool] = (
+            getattr(res, "length", None) or False
+        )
+
+        # NOTE
+        #   Both of gzip and zlib formats are detected automatically.
+        #   Some servers send deflate bodies without the zlib header, so
+        #   the input is kept until the header is checked, to decode it
+        #   again as raw deflate data if the check fails.
+        self._decoder = None
+        self._deflate_head: t.Optional[bytes] = None
+        if decode_content:
+            encoding = self.get_header("Content-Encoding")
+            encoding = encoding and encoding.strip().lower()
+            if encoding in _DECODABLE_ENCODINGS:
+                self._decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+                if encoding == "deflate":
+                    self._deflate_head = b""
 
     @property
     def headers(self) -> http.client.HTTPMessage:
@@ -73,7 +119,21 @@ class Response(t.Generic[ResponseData_t]):
         Returns:
             Value of header if existing, None otherwise.
         """
-        return self._res.getheader(name)
+        headers = self._headers
+        if headers is None:
+            # NOTE
+            #   HTTPMessage searches headers linearly on every lookup, so
+            #   a dictionary keyed by lowercased names is made at once.
+            #   Values of the same name are joined like HTTPMessage does.
+            headers = {}
+            for key, val in self._res.msg.items():
+                key = key.lower()
+                if key in headers:
+                    headers[key] = f"{headers[key]}, {val}"
+                else:
+                    headers[key] = val
+            self._headers = headers
+        return headers.get(name.lower())
 
     @property
     def uri(self) -> str:
@@ -85,22 +145,19 @@ class Response(t.Generic[ResponseData_t]):
     def status(self) -> int:
         """Response status.
         """
-        return self._res.status
+        return self._status
 
     @property
     def version(self) -> int:
         """HTTP version of the session.
         """
-        return self._res.version
+        return self._version
 
     @property
     def ok(self) -> bool:
         """If request succeeded or not.
         """
-        status = self.status
-        if 200 <= status < 300:
-            return True
-        return False
+        return 200 <= self._status < 300
 
     @property
     def is_closed(self) -> bool:
@@ -114,14 +171,62 @@ class Response(t.Generic[ResponseData_t]):
         """
         return self._res.fileno()
 
+    @property
+    def content_type(self) -> t.Optional[ContentType]:
+        """Parsed Content-Type header if existing, None otherwise.
+
+        The header is parsed at the first access and the result is cached.
+        """
+        content_type = self._content_type
+        if content_type is False:
+            content_type_raw = self.get_header("Content-Type")
+            if content_type_raw:
+                content_type = ContentType.parse(content_type_raw)
+            else:
+                content_type = None
+            self._content_type = content_type
+        return content_type
+
     @property
     def content_length(self) -> t.Optional[int]:
         """Content length of the response if existing, None otherwise.
+
+        Note:
+            If the body is decompressed on reading, this is the length
+            before decompressing it, as Content-Encoding still reports
+            the encoding the server applied.
         """
-        length = self.get_header("Content-Length")
-        if length is not None:
-            return int(length)
-        return None
+        length = self._content_length
+        if length is False:
+            # NOTE
+            #   Invalid values are ignored like HTTPResponse does, so that
+            #   the rest of the response is still available.
+            length = self.get_header("Content-Length")
+            try:
+                length = None if length is None else int(length)
+            except ValueError:
+                length = None
+            if length is not None and length < 0:
+                length = None
+            self._content_length = length
+        return length
+
+    def _decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        head = self._deflate_head
+        if head is None:
+            return self._decoder.decompress(data, max_length)
+
+        head += data
+        try:
+            data = self._decoder.decompress(data, max_length)
+        except zlib.error:
+            self._deflate_head = None
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decoder.decompress(head, max_length)
+
+        # The zlib header is checked with its first 2 bytes.
+        self._deflate_head = None if len(head) >= 2 else head
+        return data
 
     def read(self, amt: t.Optional[int] = None) -> bytes:
         """Reads and returns the response body.
@@ -130,17 +235,65 @@ class Response(t.Generic[ResponseData_t]):
             amt: Amount of the binary, all of it if None.
 
         Returns:
-            Results of reading. Its length may be less than `amt`.
+            Results of reading. Its length may be less than `amt`. If the
+            body is compressed, `amt` limits the length of the decompressed
+            binary.
         """
         if not self._is_read:
             self._is_read = True
-        return self._res.read(amt)
 
-    @cached_property
+        if self._decoder is None:
+            return self._res.read(amt)
+        if amt == 0:
+            return b""
+
+        # NOTE
+        #   Compressed input exceeding the limit is kept by the decoder as
+        #   'unconsumed_tail' and decompressed at following calls.
+        res = self._res
+        max_length = amt or 0
+        while True:
+            raw = self._decoder.unconsumed_tail
+            if not raw and not res.isclosed():
+                raw = res.read(amt)
+            data = self._decompress(raw, max_length)
+            if data:
+                return data
+            decoder = self._decoder
+            if res.isclosed() and not decoder.unconsumed_tail:
+                # The decoder can't be used after flushing it.
+                self._decoder = None
+                return decoder.flush()
+
+    def readinto(self, buffer: t.Union[bytearray, memoryview]) -> int:
+        """Reads the response body into a preallocated buffer.
+
+        Uncompressed bodies are read directly into `buffer` without any
+        intermediate `bytes` objects.
+
+        Args:
+            buffer: Writable buffer to receive the body.
+
+        Returns:
+            Number of bytes written into `buffer`, 0 at the end of the body.
+        """
+        view = memoryview(buffer).cast("B")
+        if self._decoder is None:
+            if not self._is_read:
+                self._is_read = True
+            return self._res.readinto(view)
+
+        data = self.read(len(view))
+        size = len(data)
+        view[:size] = data
+        return size
+
+    @property
     def body(self) -> bytes:
         """The raw response body.
 
         This property returns all reponse body and caches the result.
+        Bodies compressed with gzip or deflate are decompressed.
         If you want to read the response body step-by-step by chunks,
         then you can use the `read` method, but cannot use both the
         property and the `read` method.
@@ -149,12 +302,67 @@ class Response(t.Generic[ResponseData_t]):
             ResponseBodyAlreadyReadError: Raised if the `read` method has
                 been already used.
         """
-        if self._is_read:
-            raise ResponseBodyAlreadyReadError(
-                "Response body has been already read by 'read' method. "
-                "Data consistensy would be broken."
-            )
-        return self._res.read(self.content_length)
+        body = self._body
+        if body is None:
+            if self._is_read:
+                raise ResponseBodyAlreadyReadError(
+                    "Response body has been already read by 'read' method. "
+                    "Data consistensy would be broken."
+                )
+            # NOTE
+            #   HTTPResponse reads a body of known length into a single
+            #   buffer allocated up front, so the body is read at once.
+            #   Concatenating the decompressed body with the flushed tail
+            #   would copy the whole body again, so it is done only if
+            #   the tail isn't empty.
+            body = self._res.read(self.content_length)
+            if self._decoder is not None:
+                body = self._decompress(body)
+                tail = self._decoder.flush()
+                if tail:
+                    body += tail
+            self._body = body
+        return body
+
+    @property
+    def body_view(self) -> memoryview:
+        """Read-only view of the response body.
+
+        Slicing the view doesn't copy the body, which is useful to
+        handle parts of large bodies such as images and files.
+
+        Raises:
+            ResponseBodyAlreadyReadError: Raised if the `read` method has
+                been already used.
+        """
+        return memoryview(self.body)
+
+    def iter_body(self, bufsize: int = 8192) -> t.Iterator[bytes]:
+        """Iterate the response body by chunks.
+
+        Bodies compressed with gzip or deflate are decompressed as they
+        are received, so large bodies can be processed without holding
+        all of them in memory. If the `body` property has been already
+        used, the cached body is iterated.
+
+        Args:
+            bufsize: Amount of the binary read at once.
+
+        Yields:
+            Chunks of the response body.
+        """
+        body = self._body
+        if body is not None:
+            for i in range(0, len(body), bufsize):
+                yield body[i:i + bufsize]
+            return
+
+        while True:
+            data = self.read(bufsize)
+            if data:
+                yield data
+            elif self._res.isclosed():
+                break
 
     def attach(
         self,
@@ -168,23 +376,26 @@ class Response(t.Generic[ResponseData_t]):
         Returns:
             ResponseData_t: Generated object.
         """
-        content_type_raw = self.get_header("Content-Type")
-        if content_type_raw:
-            content_type = ContentType.parse(content_type_raw)
-
         if datacls is None:
-            if content_type_raw is None:
-                content_type = self._datacls.__content_type__
-            return self._datacls.__validate__(self.body, content_type)
-        else:
-            if content_type_raw is None:
-                content_type = datacls.__content_type__
-            return datacls.__validate__(self.body, content_type)
+            datacls = self._datacls
+
+        body = self.body
+        content_type = self.content_type
+        if content_type is None:
+            content_type = datacls.__content_type__
+        return datacls.__validate__(body, content_type)
 
     def close(self) -> None:
         """Close the session.
+
+        If the response was generated by a `Session`, the connection is
+        returned to it and may be reused by following requests.
         """
-        self._conn.close()
+        if self._release is None:
+            self._conn.close()
+        elif not self._is_released:
+            self._is_released = True
+            self._release(self._conn, self._res)
 
     def __enter__(self) -> Response[ResponseData_t]:
         return self
@@ -1,10 +1,9 @@
+import functools
 import typing as t
 
 from .location import (
     FlexibleLocation,
     Uri_t,
-    is_flexible_uri,
-    is_duplicated_uri,
 )
 
 
@@ -14,6 +13,7 @@ __all__ = []
 HTTPMethod_t = str
 Endpoint_t = t.TypeVar("Endpoint_t")
 Uri2Endpoints_t = t.Dict[Uri_t, t.Type[Endpoint_t]]
+_Value_t = t.TypeVar("_Value_t")
 
 
 class DuplicatedUriRegisteredError(Exception):
@@ -21,14 +21,99 @@ class DuplicatedUriRegisteredError(Exception):
     pass
 
 
+class _RouteNode(t.Generic[_Value_t]):
+    """Node of the trie of URI patterns keyed by location.
+    """
+
+    __slots__ = ("statics", "flexibles", "value", "depths", "positions")
+
+    def __init__(self) -> None:
+        self.statics: t.Dict[str, _RouteNode[_Value_t]] = {}
+        # Pairs of bound `is_valid` methods of flexible locations and
+        # the child nodes, so that validators are called without lookup
+        self.flexibles: t.List[
+            t.Tuple[t.Callable[[str], bool], _RouteNode[_Value_t]]
+        ] = []
+        self.value: t.Optional[_Value_t] = None
+        # Numbers of locations remaining to the patterns under this node
+        self.depths: t.Set[int] = set()
+        # Indices of flexible locations on the path to this node
+        self.positions: t.Tuple[int, ...] = ()
+
+    def add(self, uri: Uri_t, value: _Value_t) -> None:
+        node = self
+        depth = len(uri)
+        for i, loc in enumerate(uri):
+            node.depths.add(depth - i)
+            if isinstance(loc, FlexibleLocation):
+                child = _RouteNode()
+                child.positions = node.positions + (i,)
+                node.flexibles.append((loc.is_valid, child))
+            else:
+                child = node.statics.get(loc)
+                if child is None:
+                    child = node.statics[loc] = _RouteNode()
+                    child.positions = node.positions
+            node = child
+        node.depths.add(0)
+        node.value = value
+
+    def find_overlapped(self, uri: Uri_t) -> t.Optional[_Value_t]:
+        """Find a pattern overlapping with `uri` under this node.
+
+        Flexible locations of both of the patterns are regarded as
+        matching any locations, in the same way as `is_duplicated_uri`.
+
+        Args:
+            uri: URI pattern to be searched.
+
+        Returns:
+            Value of the overlapping pattern if found, None otherwise.
+        """
+        depth = len(uri)
+        stack = [(self, 0)]
+        while stack:
+            node, i = stack.pop()
+            if depth - i not in node.depths:
+                continue
+            if i == depth:
+                return node.value
+
+            loc = uri[i]
+            for _, child in node.flexibles:
+                stack.append((child, i + 1))
+            if isinstance(loc, FlexibleLocation):
+                for child in node.statics.values():
+                    stack.append((child, i + 1))
+            else:
+                child = node.statics.get(loc)
+                if child is not None:
+                    stack.append((child, i + 1))
+        return None
+
+
 class Router(t.Generic[Endpoint_t]):
     """Operator of routing request to `Endpoint` by URI.
     """
 
+    __cache_size__ = 4096
+
     def __init__(self) -> None:
         self._raw_uri2endpoint: Uri2Endpoints_t = {}
         self.uri2endpoint: Uri2Endpoints_t = {}
-        self.uris_flexible: t.List[Uri_t] = []
+        self._endpoint2uris: t.Dict[t.Type[Endpoint_t], t.List[Uri_t]] = {}
+        self._root: _RouteNode[t.Type[Endpoint_t]] = _RouteNode()
+        self._raw_root: _RouteNode[Uri_t] = _RouteNode()
+        # Endpoints of URI patterns with only static locations keyed by path
+        self._static_paths: t.Dict[str, t.Type[Endpoint_t]] = {}
+
+        # NOTE
+        #   Results of validation are cached by path, since a small set of
+        #   paths usually dominates requests. The cache is cleared whenever
+        #   a new URI pattern is registered.
+        self._validate_cached = functools.lru_cache(
+            maxsize=self.__cache_size__,
+        )(self._search)
 
     def register(
         self,
@@ -47,15 +132,15 @@ class Router(t.Generic[Endpoint_t]):
             DuplicatedUriRegisteredError: Raised if given URI pattern
                 matches one already registered.
         """
-        for uri_registered in self._raw_uri2endpoint.keys():
-            if is_duplicated_uri(uri_registered, uri):
-                raise DuplicatedUriRegisteredError(
-                    "Duplicated URIs were detected.\n"
-                    f"URI pattern 1: {uri_registered}\n"
-                    f"URI pattern 2: {uri}"
-                )
-        else:
-            self._raw_uri2endpoint[uri] = endpoint
+        uri_registered = self._raw_root.find_overlapped(uri)
+        if uri_registered is not None:
+            raise DuplicatedUriRegisteredError(
+                "Duplicated URIs were detected.\n"
+                f"URI pattern 1: {uri_registered}\n"
+                f"URI pattern 2: {uri}"
+            )
+        self._raw_root.add(uri, uri)
+        self._raw_uri2endpoint[uri] = endpoint
 
         if isinstance(version, str):
             version = (version,)
@@ -66,9 +151,18 @@ class Router(t.Generic[Endpoint_t]):
             uris = [uri]
 
         for _uri in uris:
-            if is_flexible_uri(_uri):
-                self.uris_flexible.append(_uri)
+            self._root.add(_uri, endpoint)
+            point = self.uri2endpoint.get(_uri)
+            if point is not None:
+                self._endpoint2uris[point].remove(_uri)
             self.uri2endpoint[_uri] = endpoint
+            self._endpoint2uris.setdefault(endpoint, []).append(_uri)
+            if all(
+                isinstance(loc, str) and loc and "/" not in loc
+                for loc in _uri
+            ):
+                self._static_paths["/" + "/".join(_uri)] = endpoint
+        self._validate_cached.cache_clear()
 
     def validate(
         self,
@@ -95,35 +189,55 @@ class Router(t.Generic[Endpoint_t]):
             Pair of values of flexible locations and `Endpoint` if specified
             `uri` is valid.
         """
-        uri = tuple(uri[1:].split("/"))
-        if not uri[0]:
-            uri = ()
-
-        endpoint = self.uri2endpoint.get(uri)
-        if endpoint:
+        # NOTE
+        #   Paths of static URI patterns are resolved by one lookup without
+        #   splitting them into locations.
+        endpoint = self._static_paths.get(uri)
+        if endpoint is not None:
             return ((), endpoint)
+        return self._validate_cached(uri)
 
-        depth = len(uri)
-        for flexible in self.uris_flexible:
-            if len(flexible) != depth:
+    def _search(
+        self,
+        uri: str,
+    ) -> t.Tuple[t.Tuple[str, ...], t.Optional[t.Type[Endpoint_t]]]:
+        locs = uri[1:].split("/")
+        if not locs[0]:
+            locs = []
+
+        # NOTE
+        #   Walking the trie of URI patterns with an explicit stack. Static
+        #   locations are tried before flexible ones, and flexible ones are
+        #   tried in order of registration if a branch comes to a dead end.
+        depth = len(locs)
+        stack = [(self._root, 0)]
+        while stack:
+            node, i = stack.pop()
+            if i == depth:
+                if node.value is not None:
+                    # NOTE
+                    #   Flexible locations are picked up only when a
+                    #   pattern matches, not for every branch tried.
+                    positions = node.positions
+                    if positions:
+                        flexibles = tuple([locs[j] for j in positions])
+                    else:
+                        flexibles = ()
+                    return (flexibles, node.value)
                 continue
 
-            flexibles_received = []
-
-            # Judging each locations
-            for loc_req, loc_flex in zip(uri, flexible):
-                if isinstance(loc_flex, FlexibleLocation):
-                    if not loc_flex.is_valid(loc_req):
-                        break
+            # NOTE
+            #   Branches which have no patterns of the remaining depth are
+            #   skipped before validating the location.
+            loc = locs[i]
+            rest = depth - i - 1
+            for is_valid, child in reversed(node.flexibles):
+                if rest in child.depths and is_valid(loc):
+                    stack.append((child, i + 1))
 
-                    flexibles_received.append(loc_req)
-                else:
-                    if loc_req != loc_flex:
-                        break
-            else:
-                # Correct case
-                endpoint = self.uri2endpoint.get(flexible)
-                return (tuple(flexibles_received), endpoint)
+            child = node.statics.get(loc)
+            if child is not None and rest in child.depths:
+                stack.append((child, i + 1))
 
         # Could not find it
         return ((), None)
@@ -137,7 +251,4 @@ class Router(t.Generic[Endpoint_t]):
         Returns:
             Result of searching.
         """
-        return [
-            uri for uri, point in self.uri2endpoint.items()
-            if point is endpoint
-        ]
+        return self._endpoint2uris.get(endpoint, []).copy()
@@ -1,3 +1,4 @@
+import sys
 import typing as t
 
 from ..endpoint import ASGIHTTPEndpoint, WSGIEndpoint
@@ -15,7 +16,10 @@ CallbackDecorator_t = t.Callable[[Callback_t], Callback_t]
 
 
 def _get_bamboo_attr(attr: str) -> str:
-    return f"__bamboo_{attr}__"
+    # NOTE
+    #   Names made at runtime aren't interned unlike identifiers in code,
+    #   so they are interned to be compared by identity in dict lookups.
+    return sys.intern(f"__bamboo_{attr}__")
 
 
 class DuplicatedInfoError(Exception):
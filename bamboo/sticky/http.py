@@ -1,9 +1,9 @@
-from abc import ABCMeta, abstractmethod
+from binascii import a2b_base64
 import dataclasses
 import functools
 import inspect
 import ipaddress
-import re
+from types import MappingProxyType
 import typing as t
 
 from . import (
@@ -32,34 +32,37 @@ from ..error import (
     ErrInfo,
 )
 from ..http import AuthSchemes, HTTPStatus
-from ..util.convert import decode2binary
 
 
-class CallbackConfigBase(metaclass=ABCMeta):
+class CallbackConfigBase:
 
     ATTR: str
 
-    @abstractmethod
     def get(self) -> t.Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def set(self, *args, **kwargs) -> Callback_t:
-        pass
+        raise NotImplementedError
 
+    @classmethod
+    def _setdefault(cls, callback: Callback_t, default: t.Any) -> t.Any:
+        # NOTE
+        #   functools.wraps copies '__dict__' of the original callback to
+        #   its wrapper, so the registry is shared by all of them. Configs
+        #   must be set on wrappers after functools.wraps is applied, or
+        #   the registries set on them will be replaced by the original.
+        return callback.__dict__.setdefault(cls.ATTR, default)
 
-class HTTPEndpointConfigBase(metaclass=ABCMeta):
 
-    ATTR: str
+class HTTPEndpointConfigBase:
 
+    ATTR: str
 
-    @abstractmethod
     def get(self) -> t.Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def set(self, *args, **kwargs) -> HTTPMixIn:
-        pass
+        raise NotImplementedError
 
 
 class HTTPErrorConfig(CallbackConfigBase):
@@ -67,18 +70,20 @@ class HTTPErrorConfig(CallbackConfigBase):
     ATTR = _get_bamboo_attr("errors")
 
     def __init__(self, callback) -> None:
-        if not hasattr(callback, self.ATTR):
-            setattr(callback, self.ATTR, set())
-
         self._callback = callback
-        self._registered: t.Set[ErrInfo] = getattr(callback, self.ATTR)
 
     def get(self) -> t.Tuple[t.Type[ErrInfo], ...]:
-        return tuple(self._registered)
+        return tuple(self._callback.__dict__.get(self.ATTR, ()))
 
     def set(self, *errors: t.Type[ErrInfo]) -> Callback_t:
+        # NOTE
+        #   Dictionaries are used as sets keeping order of registration.
+        registered: t.Dict[t.Type[ErrInfo], None] = self._setdefault(
+            self._callback,
+            {},
+        )
         for err in errors:
-            self._registered.add(err)
+            registered[err] = None
         return self._callback
 
 
@@ -139,6 +144,10 @@ class DataFormatInfo:
     err_noheader: ErrInfo = DEFAULT_HEADER_NOT_FOUND_ERROR
 
 
+# Body given to callbacks of endpoints receiving no input
+_EMPTY_BYTES = b""
+
+
 class DataFormatConfig(CallbackConfigBase):
 
     ATTR = _get_bamboo_attr("data_format")
@@ -149,10 +158,10 @@ class DataFormatConfig(CallbackConfigBase):
         self._callback = callback
 
     def get(self) -> t.Optional[DataFormatInfo]:
-        return getattr(self._callback, self.ATTR, None)
+        return self._callback.__dict__.get(self.ATTR)
 
     def set(self, dataformat: DataFormatInfo) -> Callback_t:
-        setattr(self._callback, self.ATTR, dataformat)
+        self._callback.__dict__[self.ATTR] = dataformat
         if not dataformat.is_validate:
             return self._callback
 
@@ -169,24 +178,46 @@ class DataFormatConfig(CallbackConfigBase):
 
         return func(self._callback, dataformat)
 
+    @staticmethod
+    def _register_errors(
+        callback: Callback_t,
+        dataformat: DataFormatInfo,
+    ) -> Callback_t:
+        # NOTE
+        #   The wrappers check the Content-Type header by themselves, so
+        #   only information of the header and errors is registered.
+        errors = [dataformat.err_validate.__class__]
+        err_noheader = dataformat.err_noheader
+        if err_noheader:
+            errors.append(err_noheader.__class__)
+        info = RequiredHeaderInfo("Content-Type", err_noheader, False)
+        callback = RequiredHeaderConfig(callback).register(info)
+        return HTTPErrorConfig(callback).set(*errors)
+
     @staticmethod
     def decorate_wsgi(
         callback: Callback_WSGI_t,
         dataformat: DataFormatInfo
     ) -> Callback_WSGI_t:
 
+        validate = dataformat.input.__validate__
+        err_validate = dataformat.err_validate
+        err_noheader = dataformat.err_noheader
+
         @functools.wraps(callback)
-        @may_occur(dataformat.err_validate.__class__)
-        @has_header_of("Content-Type", dataformat.err_noheader, add_arg=False)
         def _callback(self: WSGIEndpoint, *args) -> None:
+            content_type = self.content_type
+            if content_type is None and err_noheader:
+                raise err_noheader
+
             body = self.body
             try:
-                data = dataformat.input.__validate__(body, self.content_type)
+                data = validate(body, content_type)
             except ApiValidationFailedError:
-                raise dataformat.err_validate
+                raise err_validate
             callback(self, data, *args)
 
-        return _callback
+        return DataFormatConfig._register_errors(_callback, dataformat)
 
     @staticmethod
     def decorate_wsgi_no_input(
@@ -196,7 +227,10 @@ class DataFormatConfig(CallbackConfigBase):
 
         @functools.wraps(callback)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            setattr(self, "body", b"")
+            # NOTE
+            #   The body is a non-data descriptor, so assigning the value
+            #   to the instance shadows it without calling the getter.
+            self.body = _EMPTY_BYTES
             callback(self, *args)
 
         return _callback
@@ -207,18 +241,24 @@ class DataFormatConfig(CallbackConfigBase):
         dataformat: DataFormatInfo
     ) -> Callback_ASGI_t:
 
+        validate = dataformat.input.__validate__
+        err_validate = dataformat.err_validate
+        err_noheader = dataformat.err_noheader
+
         @functools.wraps(callback)
-        @may_occur(dataformat.err_validate.__class__)
-        @has_header_of("Content-Type", dataformat.err_noheader, add_arg=False)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
+            content_type = self.content_type
+            if content_type is None and err_noheader:
+                raise err_noheader
+
             body = await self.body
             try:
-                data = dataformat.input.__validate__(body, self.content_type)
+                data = validate(body, content_type)
             except ApiValidationFailedError:
-                raise dataformat.err_validate
+                raise err_validate
             await callback(self, data, *args)
 
-        return _callback
+        return DataFormatConfig._register_errors(_callback, dataformat)
 
     @staticmethod
     def decorate_asgi_no_input(
@@ -226,12 +266,14 @@ class DataFormatConfig(CallbackConfigBase):
         dataformat: DataFormatInfo
     ) -> Callback_ASGI_t:
 
+        # NOTE
+        #   The body is an awaitable_cached_property of ASGIHTTPEndpoint,
+        #   so its cache is set up without awaiting the descriptor.
+        set_body = ASGIHTTPEndpoint.__dict__["body"]._set_cache
+
         @functools.wraps(callback)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            # NOTE
-            #   Reference awaitable_cached_property
-            body_property = await self.__class__.body
-            body_property._obj2val[self] = b""
+            set_body(self, _EMPTY_BYTES)
             await callback(self, *args)
 
         return _callback
@@ -317,17 +359,32 @@ class RequiredHeaderConfig(CallbackConfigBase):
     def __init__(self, callback: Callback_t) -> None:
         super().__init__()
 
-        if not hasattr(callback, self.ATTR):
-            setattr(callback, self.ATTR, set())
-
         self._callback = callback
-        self._registered: t.Set[RequiredHeaderInfo] = getattr(callback, self.ATTR)
 
     def get(self) -> t.Tuple[RequiredHeaderInfo]:
-        return tuple(self._registered)
+        return tuple(self._callback.__dict__.get(self.ATTR, {}).values())
+
+    def register(self, info: RequiredHeaderInfo) -> Callback_t:
+        # NOTE
+        #   Only registers the information for callbacks validating the
+        #   header by themselves, so that no more wrappers are stacked.
+        #   Information is keyed by lowercased header names, so that the
+        #   last one registered for a header replaces the others.
+        registered: t.Dict[str, RequiredHeaderInfo] = self._setdefault(
+            self._callback,
+            {},
+        )
+        registered[info.header.lower()] = info
+        return self._callback
 
     def set(self, info: RequiredHeaderInfo) -> Callback_t:
-        self._registered.add(info)
+        self.register(info)
+
+        # NOTE
+        #   Headers neither validated nor given to callbacks are only
+        #   registered, since there is nothing to do on requests.
+        if not (info.err or info.add_arg):
+            return self._callback
 
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
@@ -342,19 +399,23 @@ class RequiredHeaderConfig(CallbackConfigBase):
         info: RequiredHeaderInfo,
     ) -> Callback_WSGI_t:
 
+        header = info.header
+        err = info.err
+        add_arg = info.add_arg
+
         @functools.wraps(callback)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_header(info.header)
-            if val is None and info.err:
-                raise info.err
+            val = self.get_header(header)
+            if val is None and err:
+                raise err
 
-            if info.add_arg:
+            if add_arg:
                 callback(self, val, *args)
             else:
                 callback(self, *args)
 
-        if info.err:
-            _callback = may_occur(info.err.__class__)(_callback)
+        if err:
+            HTTPErrorConfig(_callback).set(err.__class__)
         return _callback
 
     @staticmethod
@@ -363,19 +424,23 @@ class RequiredHeaderConfig(CallbackConfigBase):
         info: RequiredHeaderInfo,
     ) -> Callback_ASGI_t:
 
+        header = info.header
+        err = info.err
+        add_arg = info.add_arg
+
         @functools.wraps(callback)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_header(info.header)
-            if val is None and info.err:
-                raise info.err
+            val = self.get_header(header)
+            if val is None and err:
+                raise err
 
-            if info.add_arg:
+            if add_arg:
                 await callback(self, val, *args)
             else:
                 await callback(self, *args)
 
-        if info.err:
-            _callback = may_occur(info.err.__class__)(_callback)
+        if err:
+            HTTPErrorConfig(_callback).set(err.__class__)
         return _callback
 
 
@@ -428,16 +493,41 @@ def has_header_of(
 @dataclasses.dataclass(eq=True, frozen=True)
 class ClientInfo:
 
-    ip: t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    ip: t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]
     port: t.Optional[int] = None
 
 
+_LOCALHOST_IPS = (
+    ipaddress.ip_address("127.0.0.1"),
+    ipaddress.ip_address("::1"),
+)
+
+
+def _normalize_ips(
+    ip: t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str],
+) -> t.Tuple[t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address], ...]:
+    if not isinstance(ip, str):
+        return (ip,)
+    if ip == "localhost":
+        return _LOCALHOST_IPS
+    return (ipaddress.ip_address(ip),)
+
+
+# NOTE
+#   Each address is mapped to whether any port is allowed and the ports
+#   allowed explicitly, so that requests are checked by one probe.
 _RestrictedClient_t = t.Dict[
     t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
-    t.Set[t.Optional[int]]
+    t.Tuple[bool, t.FrozenSet[int]]
 ]
 
 
+# NOTE
+#   Clients usually come from a small set of addresses, so parsed addresses
+#   are cached instead of being parsed on every request.
+_parse_ip = functools.lru_cache(maxsize=256)(ipaddress.ip_address)
+
+
 class RestrictedClientsConfig(CallbackConfigBase):
 
     ATTR = _get_bamboo_attr("restricted_clients")
@@ -445,25 +535,28 @@ class RestrictedClientsConfig(CallbackConfigBase):
     def __init__(self, callback: Callback_t) -> None:
         super().__init__()
 
-        if not hasattr(callback, self.ATTR):
-            setattr(callback, self.ATTR, {})
-
         self._callback = callback
-        self._registered: _RestrictedClient_t = getattr(callback, self.ATTR)
 
-    def get(self) -> _RestrictedClient_t:
-        return self._registered.copy()
+    def get(self) -> t.Mapping[
+        t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+        t.Tuple[bool, t.FrozenSet[int]]
+    ]:
+        return MappingProxyType(self._callback.__dict__.get(self.ATTR, {}))
 
     def set(
         self,
         *clients: ClientInfo,
         err: ErrInfo = DEFAULT_NOT_APPLICABLE_IP_ERROR
     ) -> Callback_t:
+        registered: _RestrictedClient_t = self._setdefault(self._callback, {})
         for client in clients:
-            ports = self._registered.get(client.ip)
-            if ports is None:
-                self._registered[client.ip] = set()
-            self._registered[client.ip].add(client.port)
+            for ip in _normalize_ips(client.ip):
+                any_port, ports = registered.get(ip, (False, frozenset()))
+                if client.port is None:
+                    any_port = True
+                else:
+                    ports = ports | {client.port}
+                registered[ip] = (any_port, ports)
 
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
@@ -477,24 +570,23 @@ class RestrictedClientsConfig(CallbackConfigBase):
         callback: Callback_WSGI_t,
         err: ErrInfo
     ) -> Callback_WSGI_t:
-        acceptables = getattr(callback, cls.ATTR, set())
+        get_entry = callback.__dict__.get(cls.ATTR, {}).get
 
         @functools.wraps(callback)
-        @may_occur(err.__class__)
         def _callback(self: WSGIEndpoint, *args) -> None:
             ip, port = self.get_client_addr()
             if ip is None:
                 raise err
 
-            client = ClientInfo(ipaddress.ip_address(ip), port)
-            ports = acceptables.get(client.ip)
-            if ports is None:
+            entry = get_entry(_parse_ip(ip))
+            if entry is None:
                 raise err
-            if not(None in ports or client.port in ports):
+            any_port, ports = entry
+            if not any_port and port not in ports:
                 raise err
             callback(self, *args)
 
-        return _callback
+        return HTTPErrorConfig(_callback).set(err.__class__)
 
     @classmethod
     def decorate_asgi(
@@ -502,24 +594,23 @@ class RestrictedClientsConfig(CallbackConfigBase):
         callback: Callback_ASGI_t,
         err: ErrInfo
     ) -> Callback_ASGI_t:
-        acceptables = getattr(callback, cls.ATTR, set())
+        get_entry = callback.__dict__.get(cls.ATTR, {}).get
 
         @functools.wraps(callback)
-        @may_occur(err.__class__)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
             ip, port = self.get_client_addr()
             if ip is None:
                 raise err
 
-            client = ClientInfo(ipaddress.ip_address(ip), port)
-            ports = acceptables.get(client.ip)
-            if ports is None:
+            entry = get_entry(_parse_ip(ip))
+            if entry is None:
                 raise err
-            if not(None in ports or client.port in ports):
+            any_port, ports = entry
+            if not any_port and port not in ports:
                 raise err
             await callback(self, *args)
 
-        return _callback
+        return HTTPErrorConfig(_callback).set(err.__class__)
 
 
 def restricts_client(
@@ -577,11 +668,11 @@ class AuthSchemeConfig(CallbackConfigBase):
         self._callback = callback
 
     def get(self) -> t.Optional[str]:
-        return getattr(self._callback, self.ATTR, None)
+        return self._callback.__dict__.get(self.ATTR)
 
     def set(self, scheme: str, err: ErrInfo) -> Callback_t:
-        if hasattr(self._callback, self.ATTR):
-            _scheme_registered = getattr(self._callback, self.ATTR)
+        if self.ATTR in self._callback.__dict__:
+            _scheme_registered = self._callback.__dict__[self.ATTR]
             raise MultipleAuthSchemeError(
                 "Authentication scheme has already been specified as "
                 f"'{_scheme_registered}'. Do not specify multiple schemes."
@@ -590,7 +681,7 @@ class AuthSchemeConfig(CallbackConfigBase):
         if scheme not in AuthSchemes:
             raise ValueError(f"Specified scheme '{scheme}' is not supported.")
 
-        setattr(self._callback, self.ATTR, scheme)
+        self._callback.__dict__[self.ATTR] = scheme
 
         if scheme == AuthSchemes.basic:
             if inspect.iscoroutinefunction(self._callback):
@@ -606,13 +697,15 @@ class AuthSchemeConfig(CallbackConfigBase):
         return func(self._callback, err)
 
     @staticmethod
-    def _validate_auth_header(value: str, scheme: str) -> t.Optional[str]:
-        value = value.split(" ")
-        if len(value) != 2:
+    def _validate_auth_header(
+        value: t.Optional[str],
+        scheme: str,
+    ) -> t.Optional[str]:
+        if value is None:
             return None
 
-        _scheme, credentials = value
-        if _scheme != scheme:
+        _scheme, sep, credentials = value.partition(" ")
+        if not sep or _scheme != scheme or " " in credentials:
             return None
 
         return credentials
@@ -624,23 +717,31 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo
     ) -> Callback_WSGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        validate_auth_header = cls._validate_auth_header
+        scheme = AuthSchemes.basic
+
         @functools.wraps(callback)
-        @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            credentials = cls._validate_auth_header(val, AuthSchemes.basic)
+            val = self.get_header(header)
+            credentials = validate_auth_header(val, scheme)
             if credentials is None:
                 raise err
 
-            credentials = decode2binary(credentials).decode().split(":")
-            if len(credentials) != 2:
+            # NOTE
+            #   User IDs can't include colons, but passwords can.
+            try:
+                user_id, sep, pw = a2b_base64(credentials).partition(b":")
+                if not sep:
+                    raise err
+                user_id, pw = user_id.decode(), pw.decode()
+            except ValueError:
                 raise err
-
-            user_id, pw = credentials
             callback(self, user_id, pw, *args)
 
-        return _callback
+        info = RequiredHeaderInfo(header, err, False)
+        _callback = RequiredHeaderConfig(_callback).register(info)
+        return HTTPErrorConfig(_callback).set(err.__class__)
 
     @classmethod
     def decorate_asgi_basic(
@@ -649,23 +750,31 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo
     ) -> Callback_ASGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        validate_auth_header = cls._validate_auth_header
+        scheme = AuthSchemes.basic
+
         @functools.wraps(callback)
-        @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            credentials = cls._validate_auth_header(val, AuthSchemes.basic)
+            val = self.get_header(header)
+            credentials = validate_auth_header(val, scheme)
             if credentials is None:
                 raise err
 
-            credentials = decode2binary(credentials).decode().split(":")
-            if len(credentials) != 2:
+            # NOTE
+            #   User IDs can't include colons, but passwords can.
+            try:
+                user_id, sep, pw = a2b_base64(credentials).partition(b":")
+                if not sep:
+                    raise err
+                user_id, pw = user_id.decode(), pw.decode()
+            except ValueError:
                 raise err
-
-            user_id, pw = credentials
             await callback(self, user_id, pw, *args)
 
-        return _callback
+        info = RequiredHeaderInfo(header, err, False)
+        _callback = RequiredHeaderConfig(_callback).register(info)
+        return HTTPErrorConfig(_callback).set(err.__class__)
 
     @classmethod
     def decorate_wsgi_bearer(
@@ -674,17 +783,21 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo,
     ) -> Callback_WSGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        validate_auth_header = cls._validate_auth_header
+        scheme = AuthSchemes.bearer
+
         @functools.wraps(callback)
-        @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            token = cls._validate_auth_header(val, AuthSchemes.bearer)
+            val = self.get_header(header)
+            token = validate_auth_header(val, scheme)
             if token is None:
                 raise err
             callback(self, token, *args)
 
-        return _callback
+        info = RequiredHeaderInfo(header, err, False)
+        _callback = RequiredHeaderConfig(_callback).register(info)
+        return HTTPErrorConfig(_callback).set(err.__class__)
 
     @classmethod
     def decorate_asgi_bearer(
@@ -693,17 +806,21 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo,
     ) -> Callback_ASGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        validate_auth_header = cls._validate_auth_header
+        scheme = AuthSchemes.bearer
+
         @functools.wraps(callback)
-        @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            token = cls._validate_auth_header(val, AuthSchemes.bearer)
+            val = self.get_header(header)
+            token = validate_auth_header(val, scheme)
             if token is None:
                 raise err
             await callback(self, token, *args)
 
-        return _callback
+        info = RequiredHeaderInfo(header, err, False)
+        _callback = RequiredHeaderConfig(_callback).register(info)
+        return HTTPErrorConfig(_callback).set(err.__class__)
 
 
 def basic_auth(
@@ -798,17 +915,17 @@ class RequiredQueryConfig(CallbackConfigBase):
     def __init__(self, callback: Callback_t) -> None:
         super().__init__()
 
-        if not hasattr(callback, self.ATTR):
-            setattr(callback, self.ATTR, set())
-
         self._callback = callback
-        self._registered: t.Set[RequiredQueryConfig] = getattr(callback, self.ATTR)
 
-    def get(self) -> t.Tuple[RequiredHeaderInfo]:
-        return tuple(self._registered)
+    def get(self) -> t.Tuple[RequiredQueryInfo]:
+        return tuple(self._callback.__dict__.get(self.ATTR, {}).values())
 
     def set(self, info: RequiredQueryInfo) -> Callback_t:
-        self._registered.add(info)
+        registered: t.Dict[str, RequiredQueryInfo] = self._setdefault(
+            self._callback,
+            {},
+        )
+        registered[info.query] = info
 
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
@@ -822,37 +939,41 @@ class RequiredQueryConfig(CallbackConfigBase):
         info: RequiredQueryInfo,
     ) -> Callback_WSGI_t:
 
+        query = info.query
+        err_empty = info.err_empty
+        err_not_unique = info.err_not_unique
+        mapf = info.mapf
+        add_arg = info.add_arg
+
         @functools.wraps(callback)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_queries(info.query)
+            val = self.get_queries(query)
             len_val = len(val)
 
             if len_val == 0:
-                if info.err_empty:
-                    raise info.err_empty
+                if err_empty:
+                    raise err_empty
                 else:
                     val = None
             elif len_val == 1:
                 val = val[0]
             else:
-                if info.err_not_unique:
-                    raise info.err_not_unique
+                if err_not_unique:
+                    raise err_not_unique
 
-            if info.mapf is not None:
-                val = info.mapf(val)
+            if mapf is not None:
+                val = mapf(val)
 
-            if info.add_arg:
+            if add_arg:
                 callback(self, val, *args)
             else:
                 callback(self, *args)
 
-        errs = []
-        if info.err_empty:
-            errs.append(info.err_empty.__class__)
-        if info.err_not_unique:
-            errs.append(info.err_not_unique.__class__)
-        if len(errs):
-            _callback = may_occur(*errs)(_callback)
+        config = HTTPErrorConfig(_callback)
+        if err_empty:
+            config.set(err_empty.__class__)
+        if err_not_unique:
+            config.set(err_not_unique.__class__)
 
         return _callback
 
@@ -862,37 +983,41 @@ class RequiredQueryConfig(CallbackConfigBase):
         info: RequiredQueryInfo,
     ) -> Callback_ASGI_t:
 
+        query = info.query
+        err_empty = info.err_empty
+        err_not_unique = info.err_not_unique
+        mapf = info.mapf
+        add_arg = info.add_arg
+
         @functools.wraps(callback)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_queries(info.query)
+            val = self.get_queries(query)
             len_val = len(val)
 
             if len_val == 0:
-                if info.err_empty:
-                    raise info.err_empty
+                if err_empty:
+                    raise err_empty
                 else:
                     val = None
             elif len_val == 1:
                 val = val[0]
             else:
-                if info.err_not_unique:
-                    raise info.err_not_unique
+                if err_not_unique:
+                    raise err_not_unique
 
-            if info.mapf is not None:
-                val = info.mapf(val)
+            if mapf is not None:
+                val = mapf(val)
 
-            if info.add_arg:
+            if add_arg:
                 await callback(self, val, *args)
             else:
                 await callback(self, *args)
 
-        errs = []
-        if info.err_empty:
-            errs.append(info.err_empty.__class__)
-        if info.err_not_unique:
-            errs.append(info.err_not_unique.__class__)
-        if len(errs):
-            _callback = may_occur(*errs)(_callback)
+        config = HTTPErrorConfig(_callback)
+        if err_empty:
+            config.set(err_empty.__class__)
+        if err_not_unique:
+            config.set(err_not_unique.__class__)
 
         return _callback
 
@@ -924,6 +1049,12 @@ class SimpleAccessControlInfo:
     add_arg: bool = True
 
 
+# NOTE
+#   Methods of an endpoint usually allow the same origins, so sets of the
+#   origins are shared among them.
+_freeze_origins = functools.lru_cache(maxsize=256)(frozenset)
+
+
 class SimpleAccessControlConfig(CallbackConfigBase):
 
     ATTR = _get_bamboo_attr("simple_access_control")
@@ -934,14 +1065,14 @@ class SimpleAccessControlConfig(CallbackConfigBase):
         self._callback = callback
 
     def get(self) -> t.Optional[SimpleAccessControlInfo]:
-        return getattr(self._callback, self.ATTR, None)
+        return self._callback.__dict__.get(self.ATTR)
 
     def set(self, info: SimpleAccessControlInfo) -> Callback_t:
-        if hasattr(self._callback, self.ATTR):
+        if self.ATTR in self._callback.__dict__:
             raise DuplicatedInfoError(
                 "Decorating of multiple times is forbidden."
             )
-        setattr(self._callback, self.ATTR, info)
+        self._callback.__dict__[self.ATTR] = info
 
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
@@ -954,32 +1085,36 @@ class SimpleAccessControlConfig(CallbackConfigBase):
         callback: Callback_WSGI_t,
         info: SimpleAccessControlInfo,
     ) -> Callback_WSGI_t:
-        origins = set(info.origins)
+        origins = _freeze_origins(info.origins)
+        allows_any = not origins
+        allow_credentials = info.allow_credentials
+        err_not_allowed = info.err_not_allowed
+        add_arg = info.add_arg
 
         @functools.wraps(callback)
         def _callback(self: WSGIEndpoint, *args) -> None:
             # Origin
             origin = self.get_header("Origin")
             if origin:
-                if not len(origins):
+                if allows_any:
                     self.add_header("Access-Control-Allow-Origin", "*")
                 elif origin in origins:
                     self.add_header("Access-Control-Allow-Origin", origin)
                     self.add_header("Vary", "Origin")
                 else:
-                    raise info.err_not_allowed
+                    raise err_not_allowed
 
             # Credentials
-            if info.allow_credentials:
+            if allow_credentials:
                 self.add_header("Access-Control-Allow-Credentials", "true")
 
-            if info.add_arg:
+            if add_arg:
                 callback(self, origin, *args)
             else:
                 callback(self, *args)
 
-        if info.err_not_allowed:
-            _callback = may_occur(info.err_not_allowed.__class__)(_callback)
+        if err_not_allowed:
+            HTTPErrorConfig(_callback).set(err_not_allowed.__class__)
         return _callback
 
     @staticmethod
@@ -987,32 +1122,36 @@ class SimpleAccessControlConfig(CallbackConfigBase):
         callback: Callback_ASGI_t,
         info: SimpleAccessControlInfo,
     ) -> Callback_ASGI_t:
-        origins = set(info.origins)
+        origins = _freeze_origins(info.origins)
+        allows_any = not origins
+        allow_credentials = info.allow_credentials
+        err_not_allowed = info.err_not_allowed
+        add_arg = info.add_arg
 
         @functools.wraps(callback)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
             # Origin
             origin = self.get_header("Origin")
             if origin:
-                if not len(origins):
+                if allows_any:
                     self.add_header("Access-Control-Allow-Origin", "*")
                 elif origin in origins:
                     self.add_header("Access-Control-Allow-Origin", origin)
                     self.add_header("Vary", "Origin")
                 else:
-                    raise info.err_not_allowed
+                    raise err_not_allowed
 
             # Credentials
-            if info.allow_credentials:
+            if allow_credentials:
                 self.add_header("Access-Control-Allow-Credentials", "true")
 
-            if info.add_arg:
+            if add_arg:
                 await callback(self, origin, *args)
             else:
                 await callback(self, *args)
 
-        if info.err_not_allowed:
-            _callback = may_occur(info.err_not_allowed.__class__)(_callback)
+        if err_not_allowed:
+            HTTPErrorConfig(_callback).set(err_not_allowed.__class__)
         return _callback
 
 
@@ -1039,12 +1178,12 @@ def allow_simple_access_control(
 # NOTE
 #   Each values should be lowercases.
 
-_CORS_SAFELISTED_REQUEST_HEADERS = {
+_CORS_SAFELISTED_REQUEST_HEADERS = frozenset((
     "accept",
     "accept-language",
     "content-language",
     "content-type",
-}
+))
 
 
 def _handle_cors_preflight(
@@ -1052,7 +1191,7 @@ def _handle_cors_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = 600,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1066,13 +1205,45 @@ def _handle_cors_preflight(
     None
 ]:
     if isinstance(allow_methods, str):
-        allow_methods = {allow_methods}
-    allow_origins = set(allow_origins)
+        allow_methods = (allow_methods,)
+    # Joined in the given order before losing it
+    methods = ", ".join(allow_methods)
+    allow_methods = frozenset(allow_methods)
+    allow_origins = frozenset(allow_origins)
+    allows_any_origin = not allow_origins
     allow_headers = set([header.lower() for header in allow_headers])
     allow_headers.update(_CORS_SAFELISTED_REQUEST_HEADERS)
+
+    # NOTE
+    #   Headers independent of requests are made up once here and added
+    #   after the ones depending on requests.
+    static_headers = []
     expose_headers = ", ".join(expose_headers)
+    if expose_headers:
+        static_headers.append(
+            ("Access-Control-Expose-Headers", expose_headers),
+        )
     if max_age:
-        max_age = str(max_age)
+        static_headers.append(("Access-Control-Max-Age", str(max_age)))
+    if allow_credentials:
+        static_headers.append(("Access-Control-Allow-Credentials", "true"))
+    static_headers = tuple(static_headers)
+
+    # NOTE
+    #   Browsers send the same lists of headers for requests from the same
+    #   page, so lists of accepted ones are cached for each of them.
+    @functools.lru_cache(maxsize=128)
+    def accept_headers(req_headers: str) -> str:
+        # NOTE
+        #   Header names are case-insensitive and may be followed by
+        #   optional whitespaces around commas.
+        return ", ".join([
+            header for header in (
+                header.strip().lower()
+                for header in req_headers.split(",")
+            )
+            if header in allow_headers
+        ])
 
     def handle(
         self: t.Union[ASGIHTTPEndpoint, WSGIEndpoint],
@@ -1083,45 +1254,36 @@ def _handle_cors_preflight(
         if origin is None and req_method is None:
             self.send_only_status(HTTPStatus.BAD_REQUEST)
 
+        # NOTE
+        #   Requests are validated before adding any headers, so that
+        #   rejected ones cost nothing more.
+        if not (allows_any_origin or origin in allow_origins):
+            raise err_not_allowed_origin
+        if req_method is None or req_method not in allow_methods:
+            raise err_not_allowed_method
+
         # Allow Origin
-        if not len(allow_origins):
+        if allows_any_origin:
             self.add_header("Access-Control-Allow-Origin", "*")
         else:
-            if origin in allow_origins:
-                self.add_header("Access-Control-Allow-Origin", origin)
-                self.add_header("Vary", "Origin")
-            else:
-                raise err_not_allowed_origin
+            self.add_header("Access-Control-Allow-Origin", origin)
+            self.add_header("Vary", "Origin")
 
         # Allow Methods
-        if req_method is None:
-            raise err_not_allowed_method
-        if req_method in allow_methods:
-            methods = ", ".join(allow_methods)
-            self.add_header("Access-Control-Allow-Methods", methods)
-        else:
-            raise err_not_allowed_method
+        self.add_header("Access-Control-Allow-Methods", methods)
 
         # Allow Headers
         if req_headers:
-            accepted_headers = ", ".join([
-                header for header in re.split(",|, ", req_headers)
-                if header in allow_headers
-            ])
+            accepted_headers = accept_headers(req_headers)
             if accepted_headers:
-                self.add_header("Access-Control-Allow-Headers", accepted_headers)
-
-        # Expose Headers
-        if expose_headers:
-            self.add_header("Access-Control-Expose-Headers", expose_headers)
-
-        # Max Age
-        if max_age:
-            self.add_header("Access-Control-Max-Age", max_age)
+                self.add_header(
+                    "Access-Control-Allow-Headers",
+                    accepted_headers,
+                )
 
-        # Allow Credentials
-        if allow_credentials:
-            self.add_header("Access-Control-Allow-Credentials", "true")
+        # Expose Headers, Max Age and Allow Credentials
+        for name, val in static_headers:
+            self.add_header(name, val)
 
         self.send_only_status(HTTPStatus.NO_CONTENT)
 
@@ -1133,7 +1295,7 @@ def get_wsgi_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = 600,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1168,7 +1330,7 @@ def get_asgi_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = 600,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1205,7 +1367,7 @@ class PreFlightInfo:
     allow_origins: t.Tuple[str] = ()
     allow_headers: t.Tuple[str] = ()
     expose_headers: t.Tuple[str] = ()
-    max_age: t.Optional[int] = None
+    max_age: t.Optional[int] = 600
     allow_credentials: bool = False
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR
@@ -1242,14 +1404,17 @@ class PreFlightConfig(HTTPEndpointConfigBase):
         )
 
         # Set other methods
-        for name, res_method in self._endpoint._res_methods.copy().items():
-            res_method = allow_simple_access_control(
-                *info.allow_origins,
-                allow_credentials=info.allow_credentials,
-                err_not_allowed=info.err_not_allowed_origin,
-                add_arg=info.add_arg,
-            )(res_method)
-            set_response_method(self._endpoint, name, res_method)
+        # NOTE
+        #   One decorator is shared among the methods, so that all of them
+        #   refer to the same information of allowed origins.
+        decorator = allow_simple_access_control(
+            *info.allow_origins,
+            allow_credentials=info.allow_credentials,
+            err_not_allowed=info.err_not_allowed_origin,
+            add_arg=info.add_arg,
+        )
+        for name, res_method in list(self._endpoint._res_methods.items()):
+            set_response_method(self._endpoint, name, decorator(res_method))
 
         # Set do_OPTIONS
         if issubclass(self._endpoint, WSGIEndpoint):
@@ -1270,12 +1435,33 @@ def add_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = 600,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
     add_arg: bool = True,
 ) -> t.Callable[[HTTPMixIn], HTTPMixIn]:
+    """Set `Endpoint` up to respond to CORS preflight requests.
+
+    Args:
+        allow_methods: Methods allowed to be requested.
+        allow_origins: Origins allowed to request, any ones if empty.
+        allow_headers: Headers allowed to be sent in addition to the
+            CORS-safelisted request headers.
+        expose_headers: Headers exposed to scripts of clients.
+        max_age: Seconds for which clients may cache results of
+            preflight requests. The `Access-Control-Max-Age` header is
+            omitted if None.
+        allow_credentials: Whether requests with credentials are allowed.
+        err_not_allowed_origin: Error information sent when requests
+            come from origins not allowed.
+        err_not_allowed_method: Error information sent when methods not
+            allowed are requested.
+        add_arg: Whether origins are given as callbacks' arguments.
+
+    Returns:
+        Decorator to make `Endpoint` to be set up for preflight requests.
+    """
     info = PreFlightInfo(
         tuple(allow_methods),
         allow_origins=tuple(allow_origins),
@@ -1315,39 +1501,29 @@ class CacheControlInfo:
     only_if_cached: bool = False
 
 
+# NOTE
+#   Fields of CacheControlInfo are defined in order of the directives and
+#   their names are ones of the directives with underscores. Boolean
+#   fields are directives without values.
+_CACHE_CONTROL_DIRECTIVES = tuple(
+    (field.name, field.name.replace("_", "-"), field.type is bool)
+    for field in dataclasses.fields(CacheControlInfo)
+)
+
+
+# NOTE
+#   Endpoints often share the same cache policy, so its header value is
+#   made once for each policy.
+@functools.lru_cache(maxsize=256)
 def _get_cache_control_value(info: CacheControlInfo) -> str:
     vals = []
-
-    if info.public:
-        vals.append("public")
-    if info.private:
-        vals.append("private")
-    if info.no_cache:
-        vals.append("no-cache")
-    if info.no_store:
-        vals.append("no-store")
-    if info.max_age is not None:
-        vals.append(f"max-age={info.max_age}")
-    if info.s_maxage is not None:
-        vals.append(f"s-maxage={info.s_maxage}")
-    if info.max_stale is not None:
-        vals.append(f"max-stale={info.max_stale}")
-    if info.min_fresh is not None:
-        vals.append(f"min-fresh={info.min_fresh}")
-    if info.stale_while_revalidate is not None:
-        vals.append(f"stale-while-revalidate={info.stale_while_revalidate}")
-    if info.stale_if_error is not None:
-        vals.append(f"stale-if-error={info.stale_if_error}")
-    if info.must_revalidate:
-        vals.append("must-revalidate")
-    if info.proxy_revalidate:
-        vals.append("proxy-revalidate")
-    if info.immutable:
-        vals.append("immutable")
-    if info.no_transform:
-        vals.append("no-transform")
-    if info.only_if_cached:
-        vals.append("only-if-cached")
+    for name, directive, is_flag in _CACHE_CONTROL_DIRECTIVES:
+        val = getattr(info, name)
+        if is_flag:
+            if val:
+                vals.append(directive)
+        elif val is not None:
+            vals.append(f"{directive}={val}")
 
     return ", ".join(vals)
 
@@ -1362,14 +1538,14 @@ class CacheControlConfig(CallbackConfigBase):
         self._callback = callback
 
     def get(self) -> t.Optional[CacheControlInfo]:
-        return getattr(self._callback, self.ATTR, None)
+        return self._callback.__dict__.get(self.ATTR)
 
     def set(self, info: CacheControlInfo) -> Callback_t:
-        if hasattr(self._callback, self.ATTR):
+        if self.ATTR in self._callback.__dict__:
             raise DuplicatedInfoError(
                 "Decorating of multiple times is forbidden."
             )
-        setattr(self._callback, self.ATTR, info)
+        self._callback.__dict__[self.ATTR] = info
 
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
@@ -1480,19 +1656,17 @@ def _handle_cookie(
     if samesite is not None:
         directives.append(f"SameSite={samesite}")
 
-    directives = "; ".join(directives)
-    form = "{name}={value}; {others}"
+    # NOTE
+    #   Parts of the header around the value are made up once, so that
+    #   only concatenating them is needed on each call.
+    prefix = f"{cookie_name}="
+    suffix = "; " + "; ".join(directives) if directives else ""
 
     def set_cookie_value(
         self: t.Union[ASGIHTTPEndpoint, WSGIEndpoint],
         value: str,
     ) -> None:
-        header_val = form.format(
-            name=cookie_name,
-            value=value,
-            others=directives,
-        )
-        self.add_header("Set-Cookie", header_val)
+        self.add_header("Set-Cookie", prefix + value + suffix)
 
     return set_cookie_value
 
@@ -1520,14 +1694,14 @@ class CookieConfig(CallbackConfigBase):
         self._callback = callback
 
     def get(self) -> t.Optional[CookieInfo]:
-        return getattr(self._callback, self.ATTR, None)
+        return self._callback.__dict__.get(self.ATTR)
 
     def set(self, info: CookieInfo) -> Callback_t:
-        if hasattr(self._callback, self.ATTR):
+        if self.ATTR in self._callback.__dict__:
             raise DuplicatedInfoError(
                 "Decorating of multiple times is forbidden."
             )
-        setattr(self._callback, self.ATTR, info)
+        self._callback.__dict__[self.ATTR] = info
 
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
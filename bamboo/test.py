@@ -1,7 +1,9 @@
 from __future__ import annotations
 import dataclasses
 import multiprocessing
+import os
 import signal
+import socket
 import sys
 import time
 import typing as t
@@ -48,13 +50,34 @@ def serve_at(form: WSGIServerForm) -> None:
         print()
         f_log.flush()
         f_log.close()
-        sys.exit()
+        # NOTE
+        #   Nothing is left to be finalized in the child, so it exits
+        #   without running the interpreter shutdown.
+        os._exit(0)
 
     signal.signal(signal.SIGTERM, server_close)
     signal.signal(signal.SIGINT, server_close)
     server.serve_forever()
 
 
+def _wait_until_ready(form: WSGIServerForm, deadline: float) -> None:
+    """Wait until the server of the form accepts connections.
+
+    Args:
+        form: Dataclass describing information of the server application.
+        deadline: Value of `time.monotonic` to give up waiting.
+    """
+    address = (form.host or "localhost", form.port)
+    while True:
+        try:
+            with socket.create_connection(address, timeout=0.1):
+                return
+        except OSError:
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(0.005)
+
+
 class WSGITestExecutor:
     """Utility class that can execute server applications at child processes.
 
@@ -85,7 +108,7 @@ class WSGITestExecutor:
         for form in forms:
             self._forms.append(form)
 
-    def start_serve(self, waiting: float = 0.05) -> WSGITestExecutor:
+    def start_serve(self, waiting: float = 1.0) -> WSGITestExecutor:
         """Run registered server applications at child processes.
 
         This object has feature of context manager and the method
@@ -93,7 +116,8 @@ class WSGITestExecutor:
         sentence and in it, can define logic of clients.
 
         Args:
-        waiting: Waiting time after running the processes.
+            waiting: Maximum waiting time for the servers to start
+                accepting connections after running the processes.
 
         Returns:
             This object itself.
@@ -110,7 +134,13 @@ class WSGITestExecutor:
             child = multiprocessing.Process(target=serve_at, args=(form,))
             child.start()
             self._children.append(child)
-        time.sleep(waiting)
+
+        # NOTE
+        #   Servers are probed instead of sleeping for fixed time, so that
+        #   clients wait only until the servers get ready.
+        deadline = time.monotonic() + waiting
+        for form in self._forms:
+            _wait_until_ready(form, deadline)
 
         return self
 
@@ -120,8 +150,13 @@ class WSGITestExecutor:
         Args:
             pop: If the registered forms is to be removed.
         """
-        for child in self._children:
+        # NOTE
+        #   All the children are signaled first, so that they exit at the
+        #   same time while the parent waits for them.
+        children = self._children
+        for child in children:
             child.terminate()
+        for child in children:
             child.join()
             child.close()
 
@@ -132,14 +167,15 @@ class WSGITestExecutor:
         self,
         func: t.Callable[[t.Tuple[t.Any, ...]], None],
         args: t.Tuple[t.Any, ...] = (),
-        waiting: float = 0.1,
+        waiting: float = 1.0,
     ) -> None:
         """Executes a simple client-server test.
 
         Args:
             func: Function executed after all the server applications start.
             args: Arguments of the func.
-            waiting: Waiting time after running the applications.
+            waiting: Maximum waiting time for the servers to start
+                accepting connections after running the applications.
         """
         with self.start_serve(waiting=waiting):
             func(*args)
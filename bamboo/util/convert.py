@@ -1,6 +1,18 @@
-import base64
+import binascii
 import typing as t
 
+# NOTE
+#   pybase64 is an optional dependency providing the same functions as the
+#   base64 module with SIMD accelerated codecs.
+try:
+    import pybase64 as base64
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:
+    import base64
+
+    def _b64encode_as_string(data: t.Union[bytes, bytearray]) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
 
 __all__ = [
     "decode2binary",
@@ -11,20 +23,22 @@ __all__ = [
 
 
 def encode_binary(data: t.Union[bytes, bytearray]) -> str:
-    return base64.b64encode(data).decode()
+    return _b64encode_as_string(data)
 
 
 def encode_base64_string(data: str) -> str:
-    return encode_binary(data.encode())
+    return _b64encode_as_string(data.encode())
 
 
 def decode2binary(data: str) -> bytes:
-    return base64.b64decode(data.encode())
+    # Both of the codecs accept ASCII strings without encoding them
+    return base64.b64decode(data)
 
 
 def unparse_qs(query: t.Dict[str, t.List[str]]) -> str:
-    params = []
-    for key, vals in query.items():
-        repr_vals = ",".join(vals)
-        params.append("=".join((key, repr_vals)))
-    return "&".join(params)
+    # NOTE
+    #   str.join makes a list from any iterable given, so a list is built
+    #   directly rather than through a generator.
+    return "&".join([
+        f"{key}={','.join(vals)}" for key, vals in query.items()
+    ])
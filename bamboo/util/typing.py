@@ -1,3 +1,4 @@
+import functools
 import sys
 import typing as t
 
@@ -28,3 +29,14 @@ else:
                 res = (list(res[:-1]), res[-1])
             return res
         return ()
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_hints(obj: t.Any) -> t.Dict[str, t.Any]:
+    """Cached version of `typing.get_type_hints`.
+
+    Resolving type hints evaluates annotations every time, so the results
+    are cached for classes used on every request such as `ApiData`.
+    Don't modify the returned dictionary.
+    """
+    return t.get_type_hints(obj)
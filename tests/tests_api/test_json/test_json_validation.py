@@ -66,6 +66,10 @@ data_key_not_included = json.dumps({
     "Name": "hogehoge", "age": 30,
 }).encode()
 
+data_not_object = json.dumps([
+    {"name": "hogehoge", "age": 18},
+]).encode()
+
 data_default_value = json.dumps({
     "name": "hogehoge"
 }).encode()
@@ -116,6 +120,11 @@ class TestJsonValidation(unittest.TestCase):
             data = TestUnionData.__validate__(data_union, not_json_content_type)
         self.assertIsInstance(err.exception, ApiValidationFailedError)
 
+    def test_not_json_object(self):
+        with self.assertRaises(ApiValidationFailedError) as err:
+            data = TestUnionData.__validate__(data_not_object, json_content_type)
+        self.assertIsInstance(err.exception, ApiValidationFailedError)
+
     def test_default_value(self):
         data = TestUnionData.__validate__(data_default_value, json_content_type)
         self.assertEqual(data.name, "hogehoge")
@@ -1,7 +1,10 @@
+import gzip
 import unittest
+import zlib
 
 from bamboo import (
     ContentType,
+    HTTPStatus,
     MediaTypes,
     WSGIApp,
     WSGIEndpoint,
@@ -49,6 +52,60 @@ class MockImageEndpoint(WSGIEndpoint):
         self.send_body(image, content_type=ContentType(MediaTypes.jpeg))
 
 
+@app.route("mock", "image", "gzip")
+class MockGzipImageEndpoint(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        with open(PATH_IMAGE, "rb") as f:
+            image = f.read()
+
+        self.add_header("Content-Encoding", "gzip")
+        self.send_body(
+            gzip.compress(image),
+            content_type=ContentType(MediaTypes.jpeg),
+        )
+
+
+@app.route("mock", "image", "deflate")
+class MockDeflateImageEndpoint(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        with open(PATH_IMAGE, "rb") as f:
+            image = f.read()
+
+        self.add_header("Content-Encoding", "deflate")
+        self.send_body(
+            zlib.compress(image),
+            content_type=ContentType(MediaTypes.jpeg),
+        )
+
+
+@app.route("mock", "image", "deflate", "raw")
+class MockRawDeflateImageEndpoint(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        with open(PATH_IMAGE, "rb") as f:
+            image = f.read()
+
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        image = compressor.compress(image) + compressor.flush()
+        self.add_header("Content-Encoding", "deflate")
+        self.send_body(image, content_type=ContentType(MediaTypes.jpeg))
+
+
+@app.route("mock", "length")
+class MockInvalidLengthEndpoint(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        self.add_header("Content-Length", "abc")
+        self.send_only_status(HTTPStatus.NO_CONTENT)
+
+    def do_HEAD(self) -> None:
+        self.add_header("Content-Length", "10")
+        self.add_header("Content-Length", "10")
+        self.send_only_status()
+
+
 class TestHTTPRequest(unittest.TestCase):
 
     @classmethod
@@ -80,6 +137,87 @@ class TestHTTPRequest(unittest.TestCase):
 
         self.assertEqual(image_ideal, data)
 
+    def test_get_gzip_image(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        uri = "http://localhost:8000/mock/image/gzip"
+        with http.get(uri) as res:
+            self.assertEqual(res.get_header("Content-Encoding"), "gzip")
+            data = res.body
+
+        self.assertEqual(image_ideal, data)
+
+    def test_get_gzip_image_accepted_explicitly(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        uri = "http://localhost:8000/mock/image/gzip"
+        headers = {"Accept-Encoding": "gzip"}
+        with http.get(uri, headers=headers) as res:
+            self.assertEqual(res.get_header("Content-Encoding"), "gzip")
+            data = res.body
+            self.assertEqual(res.content_length, len(data))
+
+        self.assertEqual(image_ideal, gzip.decompress(data))
+
+    def test_get_deflate_image(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        for uri in (
+            "http://localhost:8000/mock/image/deflate",
+            "http://localhost:8000/mock/image/deflate/raw",
+        ):
+            with http.get(uri) as res:
+                self.assertEqual(res.body, image_ideal)
+
+            for bufsize in (1, 1024):
+                with http.get(uri) as res:
+                    data = b"".join(res.iter_body(bufsize))
+                self.assertEqual(data, image_ideal)
+
+    def test_invalid_content_length(self):
+        uri = "http://localhost:8000/mock/length"
+        with http.get(uri) as res:
+            self.assertEqual(res.status, HTTPStatus.NO_CONTENT)
+            self.assertIsNone(res.content_length)
+            self.assertEqual(res.body, b"")
+
+        with http.head(uri) as res:
+            self.assertEqual(res.status, HTTPStatus.OK)
+            self.assertEqual(res.get_header("Content-Length"), "10, 10")
+            self.assertIsNone(res.content_length)
+            self.assertEqual(res.body, b"")
+
+    def test_iter_gzip_image(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        uri = "http://localhost:8000/mock/image/gzip"
+        with http.get(uri) as res:
+            data = b"".join(res.iter_body(1024))
+
+        self.assertEqual(image_ideal, data)
+
+    def test_readinto_gzip_image(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        uri = "http://localhost:8000/mock/image/gzip"
+        buffer = bytearray(len(image_ideal))
+        view = memoryview(buffer)
+        with http.get(uri) as res:
+            size = 0
+            while True:
+                n = res.readinto(view[size:size + 1024])
+                if not n:
+                    break
+                size += n
+
+        self.assertEqual(size, len(image_ideal))
+        self.assertEqual(image_ideal, buffer)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -74,6 +74,60 @@ class TestResponse(unittest.TestCase):
         with Response(self.conn, _res, uri) as res:
             self.assertEqual(image_ideal, res.body)
 
+    def test_body_view(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        path = "/" + os.path.join("mock", "image")
+        uri = f"http://localhost:8000" + path
+        self.conn.request("GET", path)
+        _res = self.conn.getresponse()
+        with Response(self.conn, _res, uri) as res:
+            view = res.body_view
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(image_ideal[:16], view[:16])
+            self.assertEqual(image_ideal, res.body)
+
+    def test_iter_body(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        path = "/" + os.path.join("mock", "image")
+        uri = f"http://localhost:8000" + path
+        self.conn.request("GET", path)
+        _res = self.conn.getresponse()
+        with Response(self.conn, _res, uri) as res:
+            chunks = list(res.iter_body(1024))
+            self.assertTrue(all(len(chunk) <= 1024 for chunk in chunks))
+            self.assertEqual(image_ideal, b"".join(chunks))
+
+    def test_readinto(self):
+        with open(PATH_IMAGE, "rb") as f:
+            image_ideal = f.read()
+
+        path = "/" + os.path.join("mock", "image")
+        uri = f"http://localhost:8000" + path
+        self.conn.request("GET", path)
+        _res = self.conn.getresponse()
+        buffer = bytearray(len(image_ideal))
+        with Response(self.conn, _res, uri) as res:
+            size = res.readinto(buffer)
+            self.assertEqual(res.readinto(bytearray(16)), 0)
+
+        self.assertEqual(size, len(image_ideal))
+        self.assertEqual(image_ideal, buffer)
+
+    def test_content_type(self):
+        path = "/" + os.path.join("mock", "image")
+        uri = f"http://localhost:8000" + path
+        self.conn.request("GET", path)
+        _res = self.conn.getresponse()
+        with Response(self.conn, _res, uri) as res:
+            content_type = res.content_type
+            self.assertEqual(content_type.media_type, MediaTypes.jpeg)
+            self.assertIs(content_type, res.content_type)
+            res.body
+
     def test_attach_datacls(self):
         path = "/" + os.path.join("mock", "info")
         uri = f"http://localhost:8000" + path
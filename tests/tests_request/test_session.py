@@ -0,0 +1,164 @@
+import http.client
+import socket
+import unittest
+from unittest import mock
+
+from bamboo import (
+    ASGIApp,
+    ASGIHTTPEndpoint,
+    WSGIApp,
+    WSGIEndpoint,
+    WSGIServerForm,
+    WSGITestExecutor,
+)
+from bamboo.request import https
+
+from .. import get_log_name
+from ..asgi_util import ASGIServerForm, ASGITestExecutor
+
+
+app_asgi = ASGIApp()
+app_wsgi = WSGIApp()
+PATH_ASGI_SERVER_LOG = get_log_name(__file__, "asgi")
+PATH_WSGI_SERVER_LOG = get_log_name(__file__, "wsgi")
+
+# NOTE
+#   Mock servers serve HTTP without certificates, so URIs are of HTTPS
+#   but sessions connect to the servers with plain connections.
+URI_KEEP_ALIVE = "https://localhost:8000/mock"
+URI_CLOSE = "https://localhost:8001/mock"
+KEY_KEEP_ALIVE = ("localhost", 8000)
+KEY_CLOSE = ("localhost", 8001)
+BODY = b"Hello, Client!"
+
+
+@app_asgi.route("mock")
+class MockASGIEndpoint(ASGIHTTPEndpoint):
+
+    async def do_GET(self) -> None:
+        self.send_body(BODY)
+
+    async def do_POST(self) -> None:
+        self.send_body(BODY)
+
+
+@app_wsgi.route("mock")
+class MockWSGIEndpoint(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        self.send_body(BODY)
+
+
+def get_plain_connection(host, port, timeout, *args):
+    return http.client.HTTPConnection(host, port=port, timeout=timeout)
+
+
+class DroppedConnection(http.client.HTTPConnection):
+    """Connection lost after sending a request.
+    """
+
+    def getresponse(self):
+        self.close()
+        raise http.client.RemoteDisconnected(
+            "Remote end closed connection without response"
+        )
+
+
+class TestSession(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        form_asgi = ASGIServerForm("", 8000, app_asgi, PATH_ASGI_SERVER_LOG)
+        form_wsgi = WSGIServerForm("", 8001, app_wsgi, PATH_WSGI_SERVER_LOG)
+        cls.executor_asgi = ASGITestExecutor(form_asgi).start_serve()
+        cls.executor_wsgi = WSGITestExecutor(form_wsgi).start_serve()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor_asgi.close()
+        cls.executor_wsgi.close()
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(
+            https,
+            "_get_connection",
+            get_plain_connection,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.session = https.Session(timeout=5)
+        self.addCleanup(self.session.close)
+
+    def test_reuse_connection(self):
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            self.assertEqual(res.body, BODY)
+            conn = res._conn
+
+        self.assertEqual(self.session._pool[KEY_KEEP_ALIVE], [conn])
+
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            self.assertEqual(res.body, BODY)
+            self.assertIs(res._conn, conn)
+            self.assertEqual(self.session._pool[KEY_KEEP_ALIVE], [])
+
+        self.assertEqual(self.session._pool[KEY_KEEP_ALIVE], [conn])
+
+    def test_release_unread_response(self):
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            conn = res._conn
+
+        self.assertNotIn(KEY_KEEP_ALIVE, self.session._pool)
+        self.assertIsNone(conn.sock)
+
+    def test_release_closing_response(self):
+        with self.session.get(URI_CLOSE) as res:
+            self.assertEqual(res.body, BODY)
+            conn = res._conn
+
+        self.assertNotIn(KEY_CLOSE, self.session._pool)
+        self.assertIsNone(conn.sock)
+
+    def test_drop_stale_connection(self):
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            self.assertEqual(res.body, BODY)
+            stale = res._conn
+
+        stale.sock.shutdown(socket.SHUT_WR)
+
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            self.assertEqual(res.body, BODY)
+            conn = res._conn
+
+        self.assertIsNot(conn, stale)
+        self.assertIsNone(stale.sock)
+        self.assertEqual(self.session._pool[KEY_KEEP_ALIVE], [conn])
+
+    def test_retry_idempotent_request(self):
+        dropped = DroppedConnection(*KEY_KEEP_ALIVE, timeout=5)
+        self.session._pool[KEY_KEEP_ALIVE] = [dropped]
+
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            self.assertEqual(res.body, BODY)
+            self.assertIsNot(res._conn, dropped)
+
+    def test_not_retry_non_idempotent_request(self):
+        dropped = DroppedConnection(*KEY_KEEP_ALIVE, timeout=5)
+        self.session._pool[KEY_KEEP_ALIVE] = [dropped]
+
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.session.post(URI_KEEP_ALIVE, body=BODY)
+        self.assertEqual(self.session._pool[KEY_KEEP_ALIVE], [])
+
+    def test_close(self):
+        with self.session.get(URI_KEEP_ALIVE) as res:
+            self.assertEqual(res.body, BODY)
+            conn = res._conn
+
+        self.session.close()
+        self.assertEqual(self.session._pool, {})
+        self.assertIsNone(conn.sock)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -84,6 +84,29 @@ class TestRouting(unittest.TestCase):
         self.assertDuplicatedUris(pattern_2)
         self.assertDuplicatedUris(pattern_3)
 
+    def test_validate(self):
+        router = Router()
+        router.register(("test", "hoge"), MockEndpoint)
+        router.register(("hoge", AsciiDigitLocation(4)), MockEndpoint)
+        router.register(
+            ("test", AnyStringLocation(), "image"),
+            MockEndpoint,
+            version="v1",
+        )
+
+        self.assertEqual(router.validate("/test/hoge"), ((), MockEndpoint))
+        self.assertEqual(
+            router.validate("/hoge/1234"),
+            (("1234",), MockEndpoint),
+        )
+        self.assertEqual(
+            router.validate("/v1/test/1234/image"),
+            (("1234",), MockEndpoint),
+        )
+        self.assertEqual(router.validate("/hoge/12345"), ((), None))
+        self.assertEqual(router.validate("/test/hoge/image"), ((), None))
+        self.assertEqual(router.validate("/"), ((), None))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from bamboo import (
+    ASGIApp,
+    ASGIHTTPEndpoint,
+    WSGIApp,
+    WSGIEndpoint,
+    WSGIServerForm,
+    WSGITestExecutor,
+)
+from bamboo.request import http
+from bamboo.sticky.http import add_preflight
+
+from ... import get_log_name
+from ...asgi_util import ASGIServerForm, ASGITestExecutor
+
+
+app_asgi = ASGIApp()
+app_wsgi = WSGIApp()
+PATH_ASGI_SERVER_LOG = get_log_name(__file__, "asgi")
+PATH_WSGI_SERVER_LOG = get_log_name(__file__, "wsgi")
+ALLOWED_ORIGIN = "http://allowed.example"
+
+
+@app_asgi.route()
+@add_preflight(
+    ["GET", "POST"],
+    allow_origins=[ALLOWED_ORIGIN],
+    allow_headers=["X-Token"],
+    expose_headers=["X-Result"],
+    allow_credentials=True,
+)
+class TestASGIHTTPEndpoint(ASGIHTTPEndpoint):
+
+    async def do_GET(self, origin: str) -> None:
+        self.send_only_status()
+
+
+@app_wsgi.route()
+@add_preflight(
+    ["GET", "POST"],
+    allow_origins=[ALLOWED_ORIGIN],
+    allow_headers=["X-Token"],
+    expose_headers=["X-Result"],
+    allow_credentials=True,
+)
+class TestWSGIEndpoint(WSGIEndpoint):
+
+    def do_GET(self, origin: str) -> None:
+        self.send_only_status()
+
+
+class TestStickyAddPreflight(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        form_asgi = ASGIServerForm("", 8000, app_asgi, PATH_ASGI_SERVER_LOG)
+        form_wsgi = WSGIServerForm("", 8001, app_wsgi, PATH_WSGI_SERVER_LOG)
+        cls.executor_asgi = ASGITestExecutor(form_asgi).start_serve()
+        cls.executor_wsgi = WSGITestExecutor(form_wsgi).start_serve()
+        cls.uris = ("http://localhost:8000", "http://localhost:8001")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor_asgi.close()
+        cls.executor_wsgi.close()
+
+    def test_preflight(self):
+        headers = {
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "X-Token ,Accept,  X-Unknown",
+        }
+        for uri in self.uris:
+            with http.options(uri, headers=headers) as res:
+                self.assertEqual(res.status, 204)
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Origin"),
+                    ALLOWED_ORIGIN,
+                )
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Methods"),
+                    "GET, POST",
+                )
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Headers"),
+                    "x-token, accept",
+                )
+                self.assertEqual(
+                    res.get_header("Access-Control-Expose-Headers"),
+                    "X-Result",
+                )
+                self.assertEqual(
+                    res.get_header("Access-Control-Max-Age"),
+                    "600",
+                )
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Credentials"),
+                    "true",
+                )
+
+    def test_not_allowed_origin(self):
+        headers = {
+            "Origin": "http://denied.example",
+            "Access-Control-Request-Method": "GET",
+        }
+        for uri in self.uris:
+            with http.options(uri, headers=headers) as res:
+                self.assertFalse(res.ok)
+
+    def test_not_allowed_method(self):
+        headers = {
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "DELETE",
+        }
+        for uri in self.uris:
+            with http.options(uri, headers=headers) as res:
+                self.assertFalse(res.ok)
+
+    def test_simple_request(self):
+        headers = {"Origin": ALLOWED_ORIGIN}
+        for uri in self.uris:
+            with http.get(uri, headers=headers) as res:
+                self.assertTrue(res.ok)
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Origin"),
+                    ALLOWED_ORIGIN,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,12 @@ from bamboo import (
     WSGITestExecutor,
 )
 from bamboo.request import http
-from bamboo.sticky.http import basic_auth
+from bamboo.error import DEFAULT_BASIC_AUTH_HEADER_NOT_FOUND_ERROR
+from bamboo.sticky.http import (
+    HTTPErrorConfig,
+    RequiredHeaderConfig,
+    basic_auth,
+)
 from bamboo.util.convert import encode_base64_string
 from bamboo.util.string import rand_string
 
@@ -74,6 +79,28 @@ class TestStickyVasicAuth(unittest.TestCase):
             with http.head(self.uri_wsgi, headers=headers) as res:
                 self.assertTrue(res.ok)
 
+    def test_registered_info(self):
+        err = DEFAULT_BASIC_AUTH_HEADER_NOT_FOUND_ERROR
+        callbacks = (TestASGIHTTPEndpoint.do_HEAD, TestWSGIEndpoint.do_HEAD)
+        for callback in callbacks:
+            headers = RequiredHeaderConfig(callback).get()
+            self.assertIn("Authorization", [info.header for info in headers])
+            self.assertIn(err.__class__, HTTPErrorConfig(callback).get())
+
+    def test_colon_in_password(self):
+        formatted = make_basic_credential("user", "pass:word")
+        headers = {"Authorization": "Basic " + formatted}
+        for uri in (self.uri_asgi, self.uri_wsgi):
+            with http.head(uri, headers=headers) as res:
+                self.assertTrue(res.ok)
+
+    def test_invalid_credentials(self):
+        for formatted in ("!!!", encode_base64_string("no-colon")):
+            headers = {"Authorization": "Basic " + formatted}
+            for uri in (self.uri_asgi, self.uri_wsgi):
+                with http.head(uri, headers=headers) as res:
+                    self.assertEqual(res.status, 401)
+
 
 if __name__ == "__main__":
     unittest.main()
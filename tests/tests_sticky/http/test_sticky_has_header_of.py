@@ -9,7 +9,7 @@ from bamboo import (
     WSGITestExecutor,
 )
 from bamboo.request import http
-from bamboo.sticky.http import has_header_of
+from bamboo.sticky.http import RequiredHeaderConfig, has_header_of
 from bamboo.util.string import rand_string
 
 from ... import get_log_name
@@ -105,6 +105,19 @@ class TestStickyHasHeaderOf(unittest.TestCase):
         with http.get(self.uri_wsgi, headers=dict(RANDOM_HEADERS)) as res:
             self.assertTrue(res.ok)
 
+    def test_registered_only(self):
+        def callback(self: WSGIEndpoint) -> None:
+            pass
+
+        decorated = has_header_of("X-Doc-Only", add_arg=False)(callback)
+        self.assertIs(decorated, callback)
+        headers = RequiredHeaderConfig(callback).get()
+        self.assertEqual([info.header for info in headers], ["X-Doc-Only"])
+
+        has_header_of("x-doc-only", add_arg=False)(callback)
+        headers = RequiredHeaderConfig(callback).get()
+        self.assertEqual([info.header for info in headers], ["x-doc-only"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,18 @@ from bamboo import (
     ErrInfo,
     WSGIEndpoint,
 )
-from bamboo.sticky.http import HTTPErrorConfig, may_occur
+from bamboo.api import BinaryApiData
+from bamboo.error import (
+    DEFAULT_NOT_APPLICABLE_IP_ERROR,
+    DEFUALT_INCORRECT_DATA_FORMAT_ERROR,
+)
+from bamboo.sticky.http import (
+    ClientInfo,
+    HTTPErrorConfig,
+    data_format,
+    may_occur,
+    restricts_client,
+)
 
 
 ERRORS = [type(f"TestErr{i}", (ErrInfo,), {}) for i in range(10)]
@@ -25,6 +36,19 @@ class TestASGIHTTPEndpoint(ASGIHTTPEndpoint):
         pass
 
 
+class TestStackedEndpoint(WSGIEndpoint):
+
+    @restricts_client(ClientInfo("localhost"))
+    @may_occur(*ERRORS)
+    def do_GET(self) -> None:
+        pass
+
+    @data_format(input=BinaryApiData, output=None)
+    @may_occur(*ERRORS)
+    def do_POST(self, rec_body: BinaryApiData) -> None:
+        pass
+
+
 class TestSticyMayOccur(unittest.TestCase):
 
     def check_registered(self, callback):
@@ -40,6 +64,21 @@ class TestSticyMayOccur(unittest.TestCase):
     def test_asgi(self):
         self.check_registered(TestASGIHTTPEndpoint.do_GET)
 
+    def test_stacked(self):
+        callback = TestStackedEndpoint.do_GET
+        self.check_registered(callback)
+        self.assertIn(
+            DEFAULT_NOT_APPLICABLE_IP_ERROR.__class__,
+            HTTPErrorConfig(callback).get(),
+        )
+
+        callback = TestStackedEndpoint.do_POST
+        self.check_registered(callback)
+        self.assertIn(
+            DEFUALT_INCORRECT_DATA_FORMAT_ERROR.__class__,
+            HTTPErrorConfig(callback).get(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
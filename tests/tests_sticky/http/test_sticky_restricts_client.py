@@ -41,6 +41,10 @@ class TestASGIHTTPEndpoint(ASGIHTTPEndpoint):
     async def do_HEAD(self) -> None:
         self.send_only_status()
 
+    @restricts_client(ClientInfo("localhost"))
+    async def do_POST(self) -> None:
+        self.send_only_status()
+
 
 @app_wsgi.route()
 class TestWSGIEndpoint(WSGIEndpoint):
@@ -53,6 +57,10 @@ class TestWSGIEndpoint(WSGIEndpoint):
     def do_HEAD(self) -> None:
         self.send_only_status()
 
+    @restricts_client(ClientInfo("localhost"))
+    def do_POST(self) -> None:
+        self.send_only_status()
+
 
 class TestStickyRestrictsClient(unittest.TestCase):
 
@@ -78,6 +86,10 @@ class TestStickyRestrictsClient(unittest.TestCase):
         with http.head(self.uri_asgi) as res:
             self.assertFalse(res.ok)
 
+    def test_asgi_localhost(self):
+        with http.post(self.uri_asgi) as res:
+            self.assertTrue(res.ok)
+
     def test_wsgi_correct(self):
         with http.get(self.uri_wsgi) as res:
             self.assertTrue(res.ok)
@@ -86,6 +98,10 @@ class TestStickyRestrictsClient(unittest.TestCase):
         with http.head(self.uri_wsgi) as res:
             self.assertFalse(res.ok)
 
+    def test_wsgi_localhost(self):
+        with http.post(self.uri_wsgi) as res:
+            self.assertTrue(res.ok)
+
 
 if __name__ == "__main__":
     unittest.main()
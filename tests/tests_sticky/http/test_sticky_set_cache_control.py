@@ -0,0 +1,81 @@
+import unittest
+
+from bamboo import (
+    ASGIApp,
+    ASGIHTTPEndpoint,
+    WSGIApp,
+    WSGIEndpoint,
+    WSGIServerForm,
+    WSGITestExecutor,
+)
+from bamboo.request import http
+from bamboo.sticky.http import set_cache_control
+
+from ... import get_log_name
+from ...asgi_util import ASGIServerForm, ASGITestExecutor
+
+
+app_asgi = ASGIApp()
+app_wsgi = WSGIApp()
+PATH_ASGI_SERVER_LOG = get_log_name(__file__, "asgi")
+PATH_WSGI_SERVER_LOG = get_log_name(__file__, "wsgi")
+
+
+@app_asgi.route()
+class TestASGIHTTPEndpoint(ASGIHTTPEndpoint):
+
+    @set_cache_control(public=True, no_store=True, max_age=0)
+    async def do_GET(self) -> None:
+        self.send_only_status()
+
+    @set_cache_control(public=1, no_cache=0, max_age=600, immutable=1)
+    async def do_POST(self) -> None:
+        self.send_only_status()
+
+
+@app_wsgi.route()
+class TestWSGIEndpoint(WSGIEndpoint):
+
+    @set_cache_control(public=True, no_store=True, max_age=0)
+    def do_GET(self) -> None:
+        self.send_only_status()
+
+    @set_cache_control(public=1, no_cache=0, max_age=600, immutable=1)
+    def do_POST(self) -> None:
+        self.send_only_status()
+
+
+class TestStickySetCacheControl(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        form_asgi = ASGIServerForm("", 8000, app_asgi, PATH_ASGI_SERVER_LOG)
+        form_wsgi = WSGIServerForm("", 8001, app_wsgi, PATH_WSGI_SERVER_LOG)
+        cls.executor_asgi = ASGITestExecutor(form_asgi).start_serve()
+        cls.executor_wsgi = WSGITestExecutor(form_wsgi).start_serve()
+        cls.uris = ("http://localhost:8000", "http://localhost:8001")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor_asgi.close()
+        cls.executor_wsgi.close()
+
+    def test_directives(self):
+        for uri in self.uris:
+            with http.get(uri) as res:
+                self.assertEqual(
+                    res.get_header("Cache-Control"),
+                    "public, no-store, max-age=0",
+                )
+
+    def test_non_bool_flags(self):
+        for uri in self.uris:
+            with http.post(uri) as res:
+                self.assertEqual(
+                    res.get_header("Cache-Control"),
+                    "public, max-age=600, immutable",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import base64
+import os
+import unittest
+
+from bamboo.util.convert import (
+    decode2binary,
+    encode_base64_string,
+    encode_binary,
+)
+
+
+# NOTE
+#   Lengths cover every remainder of 3, which decides the padding.
+LENGTHS = (0, 1, 2, 3, 4, 5, 57, 58, 59, 1000)
+
+
+class TestConvert(unittest.TestCase):
+
+    def test_encode_binary(self):
+        for length in LENGTHS:
+            data = os.urandom(length)
+            encoded = encode_binary(data)
+            self.assertIsInstance(encoded, str)
+            self.assertEqual(encoded, base64.b64encode(data).decode())
+            self.assertEqual(
+                encode_binary(bytearray(data)),
+                base64.b64encode(data).decode(),
+            )
+
+    def test_encode_base64_string(self):
+        data = "Hello, Bamboo! こんにちは"
+        self.assertEqual(
+            encode_base64_string(data),
+            base64.b64encode(data.encode()).decode(),
+        )
+
+    def test_decode2binary(self):
+        for length in LENGTHS:
+            data = os.urandom(length)
+            encoded = base64.b64encode(data).decode()
+            self.assertEqual(decode2binary(encoded), data)
+
+    def test_decode2binary_invalid(self):
+        with self.assertRaises(ValueError):
+            decode2binary("abc")
+
+
+if __name__ == "__main__":
+    unittest.main()